@@ -10,8 +10,8 @@ Supports three authentication methods:
 Usage:
   python3 scripts/x-api-skill.py tweet "Hello world"
   python3 scripts/x-api-skill.py reply <tweet-id> "Reply text"
-  python3 scripts/x-api-skill.py get <tweet-id>
-  python3 scripts/x-api-skill.py thread <tweet-id> [-n 20]
+  python3 scripts/x-api-skill.py get <tweet-id> [<tweet-id> ...]
+  python3 scripts/x-api-skill.py thread <tweet-id> [-n 20] [--convo-id ID]
   python3 scripts/x-api-skill.py like <tweet-id>
   python3 scripts/x-api-skill.py unlike <tweet-id>
   python3 scripts/x-api-skill.py follow <username>
@@ -21,9 +21,11 @@ Usage:
   python3 scripts/x-api-skill.py unblock <username>
   python3 scripts/x-api-skill.py search "query" [-n 10]
   python3 scripts/x-api-skill.py search-all "query" [-n 10]       (Pro access)
+  python3 scripts/x-api-skill.py search-many --file queries.txt [-n 10] [--all]
   python3 scripts/x-api-skill.py mentions [-n 10]
   python3 scripts/x-api-skill.py timeline [-n 10]
   python3 scripts/x-api-skill.py user <username>
+  python3 scripts/x-api-skill.py users <username> [<username> ...]
   python3 scripts/x-api-skill.py user-timeline <username> [-n 10] [--include-rts]
   python3 scripts/x-api-skill.py thread-chain <tweet-id> [-n 20]
   python3 scripts/x-api-skill.py quotes <tweet-id> [-n 10]
@@ -40,67 +42,474 @@ Usage:
   python3 scripts/x-api-skill.py delete <tweet-id>
   python3 scripts/x-api-skill.py verify
   python3 scripts/x-api-skill.py me
+  python3 scripts/x-api-skill.py bulk [--max-concurrency 16] < commands.txt
+
+Global options (before the command): --compact (one JSON document per line), --pretty (default)
 
 Requires: pip install requests requests-oauthlib
 """
 
 import argparse
+import contextlib
+import contextvars
+import functools
+import io
 import json
 import os
+import re
 import sys
+import threading
+import time
 from pathlib import Path
+from types import MappingProxyType
+
+
+def _maybe_load_env():
+    """Load .env from the skill directory (parent of scripts/).
+
+    python-dotenv is only imported when the file exists, and the whole step can
+    be skipped with X_API_SKILL_SKIP_DOTENV=1 when credentials come from the
+    environment already.
+    """
+    if os.environ.get("X_API_SKILL_SKIP_DOTENV"):
+        return
+    env_file = Path(__file__).resolve().parent.parent / ".env"  # resolve() so symlinked scripts still find it
+    if not env_file.exists():
+        return
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return
+    load_dotenv(env_file, override=True)
+
 
-# Load .env from the skill directory (parent of scripts/)
+_maybe_load_env()
+
+# Optional C-backed JSON serializer; falls back to the stdlib json module
 try:
-    from dotenv import load_dotenv
-    _env_file = Path(__file__).resolve().parent.parent / ".env"
-    if _env_file.exists():
-        load_dotenv(_env_file, override=True)
+    import orjson
 except ImportError:
-    pass
+    orjson = None
 
 API_BASE = "https://api.x.com/2"
 TOKEN_FILE = os.path.expanduser("~/.x-api-skill/tokens.json")
+TOKEN_REFRESH_MARGIN = 300  # refresh OAuth 2.0 tokens this many seconds before they expire
+ME_CACHE_FILE = os.path.expanduser("~/.x-api-skill/me.json")
+USER_CACHE_FILE = os.path.expanduser("~/.x-api-skill/users.json")
+USER_CACHE_TTL = 24 * 3600  # username → ID resolutions are reused for a day; handles can be renamed or reused
+REQUEST_TIMEOUT = 30  # seconds to connect and between bytes received, per HTTP request
+MAX_CONCURRENCY = 16  # ceiling for bulk parallelism; the connection pool is sized to match
+SEARCH_QUERY_MAX_LEN = 512  # recent-search query length cap
+SEARCH_ALL_QUERY_MAX_LEN = 1024  # full-archive query length cap
+LOOKUP_BATCH_SIZE = 100  # max IDs/usernames per /2/tweets and /2/users/by lookup
+STREAM_FLUSH_RECORDS = 64  # stream output is written in batches of this many tweets...
+STREAM_FLUSH_BYTES = 64 * 1024  # ...or this many bytes, whichever comes first
+TWEET_FIELDS = "created_at,author_id,conversation_id,in_reply_to_user_id,text,public_metrics"
+THREAD_TWEET_FIELDS = "created_at,author_id,in_reply_to_user_id,text,public_metrics"
+FOLLOW_USER_FIELDS = "username,name,public_metrics,description,verified"
+ENGAGER_USER_FIELDS = "username,name,public_metrics,verified"
+DM_EVENT_FIELDS = "id,text,event_type,created_at,sender_id,dm_conversation_id,attachments"
+USER_PROFILE_FIELDS = "created_at,description,location,public_metrics,verified,url,pinned_tweet_id"
+SPACE_FIELDS = "title,host_ids,created_at,participant_count,state,lang"
+LIST_FIELDS = "description,member_count,follower_count,created_at,private"
+
+# Shared request-param templates (read-only); commands copy them with {**TEMPLATE, ...}
+AUTHOR_EXPANSION = MappingProxyType({"expansions": "author_id", "user.fields": "username,name"})
+TWEET_PARAMS = MappingProxyType({"tweet.fields": "created_at,author_id,text,public_metrics", **AUTHOR_EXPANSION})
+CONVERSATION_TWEET_PARAMS = MappingProxyType(
+    {"tweet.fields": "created_at,author_id,conversation_id,text,public_metrics", **AUTHOR_EXPANSION}
+)
+SPACE_DETAIL_PARAMS = MappingProxyType({"space.fields": f"{SPACE_FIELDS},scheduled_start"})
+MY_LISTS_PARAMS = MappingProxyType({"list.fields": LIST_FIELDS})
+LIST_DETAIL_PARAMS = MappingProxyType({"list.fields": f"{LIST_FIELDS},owner_id"})
+
+
+# ── HTTP Session ──
+
+
+_session_lock = threading.Lock()
+
+
+def _get_session():
+    """Get a shared requests Session so calls reuse the TLS connection. Cached per process.
+
+    requests is imported here rather than at module level so --help and
+    argument errors never pay for it.
+
+    The pool keeps up to MAX_CONCURRENCY connections alive so bulk runs reuse
+    them instead of opening and discarding extras. Transient 5xx gateway errors
+    are retried with exponential backoff; 429s are handled by _request, which
+    knows the rate-limit window.
+    """
+    if not hasattr(_get_session, "_cached"):
+        with _session_lock:  # bulk and the helper pools can race to create it
+            if not hasattr(_get_session, "_cached"):
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+                retry = Retry(
+                    total=3,
+                    backoff_factor=0.5,
+                    status_forcelist=[502, 503, 504],
+                    raise_on_status=False,
+                )
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=MAX_CONCURRENCY, max_retries=retry)
+                session.mount("https://", adapter)
+                _get_session._cached = session
+    return _get_session._cached
+
+
+# ── Rate Limiting ──
+
+RATE_LIMIT_RETRIES = 3  # attempts after a 429 before giving up
+RATE_LIMIT_BACKOFF = 1.0  # base seconds for exponential backoff when no reset time is known
+RATE_LIMIT_MAX_WAIT = 900  # never sleep longer than one 15-minute rate-limit window
+
+# Numeric IDs, DM conversation IDs and usernames in a path collapse to {id}, so
+# "/users/123/following" and "/users/456/following" share one rate-limit bucket.
+_PATH_ID_PATTERN = re.compile(r"(?<=/)[0-9-]+(?=/|$)|(?<=/username/)[^/]+")
+
+
+class _RateLimitTracker:
+    """Track X-Rate-Limit-* headers per endpoint family and throttle before a limit is hit."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._windows = {}  # key -> (limit, remaining, reset_ts)
+        self.throttled = 0  # proactive waits + 429s seen, read by _ConcurrentRunner
+
+    @staticmethod
+    def key(method, url):
+        path = url.split("?", 1)[0]
+        if path.startswith(API_BASE):
+            path = path[len(API_BASE):]
+        return f"{method.upper()} {_PATH_ID_PATTERN.sub('{id}', path)}"
+
+    def wait_time(self, key):
+        """Seconds to wait before calling `key`.
+
+        Once remaining drops to max(2, 10% of limit) this waits for the reset,
+        but only if the reset is within RATE_LIMIT_MAX_WAIT. On longer windows
+        (e.g. 24h posting limits) a capped wait would stall without protecting
+        anything, so calls go ahead while any remain. Once none remain, the
+        wait is capped and any 429 goes through _request's retry path.
+        """
+        with self._lock:
+            window = self._windows.get(key)
+        if window is None:
+            return 0
+        limit, remaining, reset_ts = window
+        delay = reset_ts - time.time()
+        if delay <= 0:
+            with self._lock:
+                self._windows.pop(key, None)
+            return 0
+        if remaining > max(2, limit // 10):
+            return 0
+        if remaining > 0 and delay > RATE_LIMIT_MAX_WAIT:
+            return 0
+        return min(delay, RATE_LIMIT_MAX_WAIT)
+
+    def record_throttle(self):
+        with self._lock:
+            self.throttled += 1
+
+    def update(self, key, headers):
+        try:
+            limit = int(headers["x-rate-limit-limit"])
+            remaining = int(headers["x-rate-limit-remaining"])
+            reset_ts = int(headers["x-rate-limit-reset"])
+        except (KeyError, ValueError):
+            return
+        with self._lock:
+            self._windows[key] = (limit, remaining, reset_ts)
+
+    def retry_delay(self, headers, attempt):
+        """Seconds to wait after a 429: Retry-After, else the window reset, else exponential backoff."""
+        backoff = min(RATE_LIMIT_MAX_WAIT, RATE_LIMIT_BACKOFF * 2 ** attempt)
+        try:
+            return min(RATE_LIMIT_MAX_WAIT, max(backoff, float(headers["retry-after"])))
+        except (KeyError, ValueError):
+            pass
+        try:
+            return min(RATE_LIMIT_MAX_WAIT, max(backoff, int(headers["x-rate-limit-reset"]) - time.time()))
+        except (KeyError, ValueError):
+            return backoff
 
 
-# ── Authentication: OAuth 1.0a ──
+_RATE_LIMITS = _RateLimitTracker()
 
 
-def _get_creds():
-    """Load X API credentials from env or config file."""
-    ck = os.environ.get("X_CONSUMER_KEY", "")
-    cs = os.environ.get("X_CONSUMER_SECRET", "")
-    at = os.environ.get("X_ACCESS_TOKEN", "")
-    ats = os.environ.get("X_ACCESS_TOKEN_SECRET", "")
+def _request(method, url, **kwargs):
+    """Send a request on the shared session, honouring X's rate-limit headers.
 
-    if not all([ck, cs, at, ats]):
+    Waits for the window to reset when the endpoint family is nearly exhausted,
+    and retries 429 responses up to RATE_LIMIT_RETRIES times. Requests without
+    an explicit timeout get REQUEST_TIMEOUT, so a stalled connection can't hang
+    the process.
+    """
+    from requests import Timeout
+
+    kwargs.setdefault("timeout", REQUEST_TIMEOUT)
+    key = _RateLimitTracker.key(method, url)
+    attempt = 0
+    while True:
+        delay = _RATE_LIMITS.wait_time(key)
+        if delay > 0:
+            _RATE_LIMITS.record_throttle()
+            print(f"Rate limit nearly exhausted for {key}; waiting {delay:.0f}s.", file=sys.stderr)
+            time.sleep(delay)
         try:
-            with open(os.path.expanduser("~/.openclaw/openclaw.json")) as f:
-                cfg = json.load(f)
-            ev = cfg.get("env", {}).get("vars", {})
-            ck = ck or ev.get("X_CONSUMER_KEY", "")
-            cs = cs or ev.get("X_CONSUMER_SECRET", "")
-            at = at or ev.get("X_ACCESS_TOKEN", "")
-            ats = ats or ev.get("X_ACCESS_TOKEN_SECRET", "")
-        except FileNotFoundError:
-            pass
+            resp = _get_session().request(method, url, **kwargs)
+        except Timeout:
+            print(f"Error: {key} timed out after {kwargs['timeout']}s", file=sys.stderr)
+            sys.exit(1)
+        _RATE_LIMITS.update(key, resp.headers)
+        if resp.status_code != 429 or attempt >= RATE_LIMIT_RETRIES:
+            return resp
+        _RATE_LIMITS.record_throttle()
+        delay = _RATE_LIMITS.retry_delay(resp.headers, attempt)
+        print(f"Rate limited on {key}; retrying in {delay:.0f}s.", file=sys.stderr)
+        resp.close()
+        time.sleep(delay)
+        attempt += 1
+
+
+# ── Concurrency ──
+
+
+class _ConcurrentRunner:
+    """Run a function over many items on a thread pool with AIMD-controlled concurrency.
+
+    After every `window` completed calls the concurrency limit grows by 0.5 if
+    mean latency stayed within `target_latency` seconds and no request was rate
+    limited, and halves otherwise (bounded to [1, max_workers]).
+    """
+
+    def __init__(self, initial=2, max_workers=MAX_CONCURRENCY, window=20, target_latency=0.5):
+        self.limit = float(initial)
+        self.max_workers = max_workers
+        self.window = window
+        self.target_latency = target_latency
+
+    def _adjust(self, latencies, throttled):
+        mean = sum(latencies) / len(latencies)
+        if mean <= self.target_latency and not throttled:
+            self.limit = min(self.max_workers, self.limit + 0.5)
+        else:
+            self.limit = max(1.0, self.limit * 0.5)
+
+    def run(self, fn, items):
+        """Yield (item, result, error) as calls complete; `error` is the exception or SystemExit raised."""
+        from concurrent.futures import FIRST_COMPLETED, wait
+
+        def timed(item):
+            start = time.monotonic()
+            try:
+                return time.monotonic() - start, fn(item), None
+            except (Exception, SystemExit) as exc:
+                return time.monotonic() - start, None, exc
+
+        items = iter(items)
+        running = {}
+        latencies = []
+        throttled_at = _RATE_LIMITS.throttled
+        exhausted = False
+        with _thread_pool(self.max_workers) as pool:
+            while True:
+                while not exhausted and len(running) < int(self.limit):
+                    item = next(items, running)  # `running` doubles as a sentinel
+                    if item is running:
+                        exhausted = True
+                    else:
+                        running[pool.submit(timed, item)] = item
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = running.pop(future)
+                    latency, result, error = future.result()
+                    latencies.append(latency)
+                    yield item, result, error
+                if len(latencies) >= self.window:
+                    self._adjust(latencies, _RATE_LIMITS.throttled != throttled_at)
+                    latencies = []
+                    throttled_at = _RATE_LIMITS.throttled
+
+
+def _thread_pool(max_workers):
+    """A ThreadPoolExecutor whose tasks run in a copy of the submitting thread's context.
+
+    bulk captures each line's output through ContextVars, so work a command
+    fans out to helper threads has to carry that context along.
+    """
+    if not hasattr(_thread_pool, "_cached"):
+        from concurrent.futures import ThreadPoolExecutor
+
+        class ContextThreadPoolExecutor(ThreadPoolExecutor):
+            def submit(self, fn, /, *args, **kwargs):
+                return super().submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+        _thread_pool._cached = ContextThreadPoolExecutor
+    return _thread_pool._cached(max_workers=max_workers)
+
+
+_BULK_STDOUT = contextvars.ContextVar("bulk_stdout", default=None)
+_BULK_STDERR = contextvars.ContextVar("bulk_stderr", default=None)
+
+
+class _CapturedStream:
+    """Stand-in for sys.stdout/sys.stderr that sends writes to the current bulk job's buffer.
+
+    The buffer lives in a ContextVar rather than a thread-local, so output from
+    threads a command starts through _thread_pool() is captured with its job.
+    """
+
+    def __init__(self, stream, var):
+        self._stream = stream
+        self._var = var
+
+    def write(self, text):
+        buf = self._var.get()
+        return (buf if buf is not None else self._stream).write(text)
+
+    def flush(self):
+        if self._var.get() is None:
+            self._stream.flush()
+
+    @contextlib.contextmanager
+    def capture(self):
+        buf = io.StringIO()
+        token = self._var.set(buf)
+        try:
+            yield buf
+        finally:
+            self._var.reset(token)
+
+
+# ── Output ──
+
+
+COMPACT_OUTPUT = False  # set by --compact: one JSON document per line instead of indented blocks
+
+
+def _loads(data):
+    """Parse JSON from bytes or str, using orjson when it is installed.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can keep
+    catching the stdlib exception.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json(resp):
+    """Parse a response body straight from its raw bytes (drop-in for resp.json())."""
+    return _loads(resp.content)
+
+
+def _check(resp, prefix="Error", pro_feature=None):
+    """Exit with the API error body on stderr unless resp succeeded.
 
-    if not all([ck, cs, at, ats]):
+    The body is decoded as UTF-8 directly, skipping requests' charset
+    detection. pro_feature names an endpoint gated behind Pro access so a
+    403 gets a hint instead of a bare error.
+    """
+    if resp.ok:
+        return
+    body = resp.content.decode("utf-8", "replace")
+    print(f"{prefix}: {resp.status_code} {body}", file=sys.stderr)
+    if pro_feature and resp.status_code == 403:
+        print(f"Hint: {pro_feature} requires Pro access ($5,000/month).", file=sys.stderr)
+    sys.exit(1)
+
+
+def _checked_json(resp, prefix="Error", pro_feature=None):
+    """_check() the response, then parse its body."""
+    _check(resp, prefix, pro_feature)
+    return _json(resp)
+
+
+def _dumpb(obj):
+    """Serialize obj as JSON bytes: indented by default, single-line with --compact.
+
+    Uses orjson when it is installed, which skips the text-layer round-trip.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj) if COMPACT_OUTPUT else orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    if COMPACT_OUTPUT:
+        return json.dumps(obj, separators=(",", ":")).encode()
+    return json.dumps(obj, indent=2).encode()
+
+
+def _write(data):
+    """Write bytes to stdout's binary buffer, falling back to text for streams without one."""
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(data.decode())
+        return
+    sys.stdout.flush()  # keep ordering with anything already printed
+    buffer.write(data)
+
+
+def _emit(obj):
+    """Print one object as indented JSON."""
+    _write(_dumpb(obj) + b"\n")
+
+
+def _print_items(items):
+    """Print each item as indented JSON, joined into a single stdout write."""
+    if items:
+        _write(b"\n".join(_dumpb(item) for item in items) + b"\n")
+
+
+# ── Authentication: OAuth 1.0a ──
+
+
+@functools.lru_cache(maxsize=1)
+def _openclaw_vars():
+    """Parse the OpenClaw config file's env vars. Read at most once per process."""
+    try:
+        with open(os.path.expanduser("~/.openclaw/openclaw.json"), "rb") as f:
+            cfg = _loads(f.read())
+    except FileNotFoundError:
+        return {}
+    return cfg.get("env", {}).get("vars", {})
+
+
+def _cfg_var(name):
+    """Look up a config value: env var first, then the OpenClaw config file."""
+    return os.environ.get(name) or _openclaw_vars().get(name, "")
+
+
+@functools.lru_cache(maxsize=1)
+def _get_creds():
+    """Load X API credentials from env or config file. Cached per process."""
+    ck = _cfg_var("X_CONSUMER_KEY")
+    cs = _cfg_var("X_CONSUMER_SECRET")
+    at = _cfg_var("X_ACCESS_TOKEN")
+    ats = _cfg_var("X_ACCESS_TOKEN_SECRET")
+
+    if not (ck and cs and at and ats):
         print("Error: Missing X API credentials", file=sys.stderr)
         sys.exit(1)
 
     return ck, cs, at, ats
 
 
+@functools.lru_cache(maxsize=1)
 def get_oauth1():
-    """Get requests_oauthlib OAuth1 handler for raw API calls."""
+    """Get requests_oauthlib OAuth1 handler for raw API calls. Cached per process."""
     from requests_oauthlib import OAuth1
     ck, cs, at, ats = _get_creds()
     return OAuth1(ck, cs, at, ats)
 
 
+@functools.lru_cache(maxsize=1)
 def get_client():
-    """Get XDK Client for read operations (search, mentions, timeline, etc.)."""
+    """Get XDK Client for read operations (search, mentions, timeline, etc.). Cached per process."""
     from xdk import Client
     from xdk.oauth1_auth import OAuth1
     ck, cs, at, ats = _get_creds()
@@ -117,23 +526,13 @@ def get_client():
 # ── Authentication: Bearer Token (app-only) ──
 
 
+@functools.lru_cache(maxsize=1)
 def _get_bearer_token():
     """Get Bearer Token for app-only endpoints (streams, trends, spaces, full-archive search).
 
-    Checks X_BEARER_TOKEN env var first, then the OpenClaw config file.
+    Checks X_BEARER_TOKEN env var first, then the OpenClaw config file. Cached per process.
     """
-    # 1. Check env var
-    token = os.environ.get("X_BEARER_TOKEN", "")
-
-    # 2. Check config file
-    if not token:
-        try:
-            with open(os.path.expanduser("~/.openclaw/openclaw.json")) as f:
-                cfg = json.load(f)
-            token = cfg.get("env", {}).get("vars", {}).get("X_BEARER_TOKEN", "")
-        except FileNotFoundError:
-            pass
-
+    token = _cfg_var("X_BEARER_TOKEN")
     if not token:
         print("Error: Missing X_BEARER_TOKEN. Get it from https://developer.x.com/en/portal/dashboard", file=sys.stderr)
         sys.exit(1)
@@ -141,8 +540,9 @@ def _get_bearer_token():
     return token
 
 
+@functools.lru_cache(maxsize=1)
 def _bearer_headers():
-    """Get Authorization headers for Bearer Token endpoints."""
+    """Get Authorization headers for Bearer Token endpoints. Cached per process — do not mutate."""
     return {"Authorization": f"Bearer {_get_bearer_token()}"}
 
 
@@ -152,133 +552,295 @@ def _bearer_headers():
 def _load_pkce_tokens():
     """Load stored OAuth 2.0 PKCE tokens from disk."""
     try:
-        with open(TOKEN_FILE) as f:
-            return json.load(f)
+        with open(TOKEN_FILE, "rb") as f:
+            return _loads(f.read())
     except (FileNotFoundError, json.JSONDecodeError):
         return None
 
 
 def _save_pkce_tokens(tokens):
-    """Save OAuth 2.0 PKCE tokens to disk."""
+    """Save OAuth 2.0 PKCE tokens to disk (atomically, so readers never see a partial file)."""
     os.makedirs(os.path.dirname(TOKEN_FILE), exist_ok=True)
-    with open(TOKEN_FILE, "w") as f:
+    tmp_file = f"{TOKEN_FILE}.{os.getpid()}.tmp"
+    with open(tmp_file, "w") as f:
         json.dump(tokens, f, indent=2)
+    os.replace(tmp_file, TOKEN_FILE)
+
+
+@contextlib.contextmanager
+def _pkce_token_lock():
+    """Hold an exclusive lock on the token store so concurrent refreshes don't clobber each other."""
+    os.makedirs(os.path.dirname(TOKEN_FILE), exist_ok=True)
+    with open(f"{TOKEN_FILE}.lock", "w") as lock:
+        try:
+            import fcntl
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        except ImportError:
+            pass  # No flock on Windows — fall back to unlocked (but still atomic) writes
+        yield
 
 
+@functools.lru_cache(maxsize=1)
 def _get_client_id():
     """Get OAuth 2.0 Client ID from env or config."""
-    client_id = os.environ.get("X_CLIENT_ID", "")
-    if not client_id:
-        try:
-            with open(os.path.expanduser("~/.openclaw/openclaw.json")) as f:
-                cfg = json.load(f)
-            client_id = cfg.get("env", {}).get("vars", {}).get("X_CLIENT_ID", "")
-        except FileNotFoundError:
-            pass
+    client_id = _cfg_var("X_CLIENT_ID")
     if not client_id:
         print("Error: Missing X_CLIENT_ID. Required for OAuth 2.0 PKCE (bookmarks).", file=sys.stderr)
         sys.exit(1)
     return client_id
 
 
+@functools.lru_cache(maxsize=1)
 def _get_client_secret():
     """Get OAuth 2.0 Client Secret from env or config (optional for public clients)."""
-    secret = os.environ.get("X_CLIENT_SECRET", "")
-    if not secret:
-        try:
-            with open(os.path.expanduser("~/.openclaw/openclaw.json")) as f:
-                cfg = json.load(f)
-            secret = cfg.get("env", {}).get("vars", {}).get("X_CLIENT_SECRET", "")
-        except FileNotFoundError:
-            pass
-    return secret
+    return _cfg_var("X_CLIENT_SECRET")
 
 
 def _refresh_pkce_token(refresh_token):
-    """Refresh an expired OAuth 2.0 PKCE access token."""
-    import requests
-    import time
-
-    client_id = _get_client_id()
-    client_secret = _get_client_secret()
-
-    data = {
-        "grant_type": "refresh_token",
-        "refresh_token": refresh_token,
-        "client_id": client_id,
-    }
+    """Refresh an expiring OAuth 2.0 PKCE access token."""
+
+    with _pkce_token_lock():
+        # Another process may have refreshed while we were waiting for the lock
+        current = _load_pkce_tokens() or {}
+        if (current.get("refresh_token") != refresh_token
+                and current.get("expires_at", 0) - time.time() > TOKEN_REFRESH_MARGIN):
+            return current["access_token"]
+
+        client_id = _get_client_id()
+        client_secret = _get_client_secret()
+
+        data = {
+            "grant_type": "refresh_token",
+            "refresh_token": refresh_token,
+            "client_id": client_id,
+        }
 
-    auth = None
-    if client_secret:
-        auth = (client_id, client_secret)
+        auth = None
+        if client_secret:
+            auth = (client_id, client_secret)
 
-    resp = requests.post("https://api.x.com/2/oauth2/token", data=data, auth=auth)
-    if not resp.ok:
-        print(f"Error refreshing token: {resp.status_code} {resp.text}", file=sys.stderr)
-        print("Run 'x-api-skill auth' to re-authorize.", file=sys.stderr)
-        sys.exit(1)
+        resp = _request("POST", "https://api.x.com/2/oauth2/token", data=data, auth=auth)
+        if not resp.ok:
+            body = resp.content.decode("utf-8", "replace")
+            print(f"Error refreshing token: {resp.status_code} {body}", file=sys.stderr)
+            print("Run 'x-api-skill auth' to re-authorize.", file=sys.stderr)
+            sys.exit(1)
 
-    result = resp.json()
-    tokens = {
-        "access_token": result["access_token"],
-        "refresh_token": result.get("refresh_token", refresh_token),
-        "expires_at": int(time.time()) + result.get("expires_in", 7200),
-    }
-    _save_pkce_tokens(tokens)
+        result = _json(resp)
+        tokens = {
+            "access_token": result["access_token"],
+            "refresh_token": result.get("refresh_token", refresh_token),
+            "expires_at": int(time.time()) + result.get("expires_in", 7200),
+        }
+        if current.get("user_id"):
+            tokens["user_id"] = current["user_id"]  # same account, keep the cached ID
+        _save_pkce_tokens(tokens)
     return tokens["access_token"]
 
 
 def _get_oauth2_pkce_token():
-    """Get a valid OAuth 2.0 PKCE access token, refreshing if expired."""
-    import time
+    """Get a valid OAuth 2.0 PKCE access token, refreshing if close to expiry.
+
+    Within TOKEN_REFRESH_MARGIN of expiry the refresh runs in a background thread
+    and the still-valid token is returned immediately; only a token that is
+    expired (or about to be, within 60s) blocks on the refresh.
+    """
 
     tokens = _load_pkce_tokens()
     if not tokens:
         print("Error: No OAuth 2.0 tokens found. Run 'x-api-skill auth' first.", file=sys.stderr)
         sys.exit(1)
 
-    # Check expiry (refresh 60s before actual expiry)
-    if time.time() >= tokens.get("expires_at", 0) - 60:
-        refresh = tokens.get("refresh_token")
-        if not refresh:
-            print("Error: No refresh token. Run 'x-api-skill auth' to re-authorize.", file=sys.stderr)
-            sys.exit(1)
-        return _refresh_pkce_token(refresh)
+    remaining = tokens.get("expires_at", 0) - time.time()
+    if remaining > TOKEN_REFRESH_MARGIN:
+        return tokens["access_token"]
 
-    return tokens["access_token"]
+    refresh = tokens.get("refresh_token")
+    if not refresh:
+        print("Error: No refresh token. Run 'x-api-skill auth' to re-authorize.", file=sys.stderr)
+        sys.exit(1)
 
+    if remaining > 60:
+        # Non-daemon thread: the interpreter waits for it at exit, so a rotated
+        # refresh token is always saved before the process goes away.
+        threading.Thread(target=_refresh_pkce_token, args=(refresh,)).start()
+        return tokens["access_token"]
 
+    return _refresh_pkce_token(refresh)
+
+
+@functools.lru_cache(maxsize=1)
 def _oauth2_headers():
-    """Get Authorization headers for OAuth 2.0 PKCE endpoints."""
+    """Get Authorization headers for OAuth 2.0 PKCE endpoints. Cached per process — do not mutate."""
     return {"Authorization": f"Bearer {_get_oauth2_pkce_token()}"}
 
 
+def _oauth2_request(method, url, **kwargs):
+    """Send a request with the PKCE bearer token; on a 401, refresh the token once and retry."""
+    resp = _request(method, url, headers=_oauth2_headers(), **kwargs)
+    if resp.status_code != 401:
+        return resp
+    tokens = _load_pkce_tokens() or {}
+    if not tokens.get("refresh_token"):
+        return resp
+    resp.close()
+    _refresh_pkce_token(tokens["refresh_token"])
+    _oauth2_headers.cache_clear()
+    return _request(method, url, headers=_oauth2_headers(), **kwargs)
+
+
+def _fetch_pkce_user_id():
+    tokens = _load_pkce_tokens() or {}
+    if tokens.get("user_id"):
+        return tokens["user_id"]
+    resp = _oauth2_request("GET", f"{API_BASE}/users/me")
+    user_id = _checked_json(resp, "Error getting user")["data"]["id"]
+    with _pkce_token_lock():
+        tokens = _load_pkce_tokens()
+        if tokens:
+            tokens["user_id"] = user_id
+            _save_pkce_tokens(tokens)
+    return user_id
+
+
+def _get_pkce_user_id():
+    """Get the ID of the user who authorized the OAuth 2.0 PKCE token.
+
+    Stored next to the tokens in TOKEN_FILE (kept across refreshes, reset by a
+    new `auth`), so /users/me is only called once per authorization.
+    """
+    if not hasattr(_get_pkce_user_id, "_cached"):
+        _get_pkce_user_id._cached = _singleflight("pkce-me", _fetch_pkce_user_id)
+    return _get_pkce_user_id._cached
+
+
 # ── Common Helpers ──
 
 
+def _load_cache(path):
+    """Load a JSON lookup cache from disk (empty dict if missing or corrupt)."""
+    try:
+        with open(path, "rb") as f:
+            return _loads(f.read())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _save_cache(path, cache):
+    """Save a JSON lookup cache to disk (atomically, since bulk runs write it from several threads)."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_file = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_file, "w") as f:
+        json.dump(cache, f, indent=2)
+    os.replace(tmp_file, path)
+
+
+_cache_lock = threading.Lock()
+
+
+def _update_cache(path, key, value):
+    """Set one entry in a lookup cache on disk.
+
+    The file is re-read under a lock, so bulk workers resolving different
+    names don't overwrite each other's entries.
+    """
+    with _cache_lock:
+        cache = _load_cache(path)
+        cache[key] = value
+        _save_cache(path, cache)
+
+
+_inflight_lock = threading.Lock()
+_inflight = {}  # key -> Future for lookups currently being fetched
+
+
+def _singleflight(key, fn):
+    """Run fn() once for concurrent callers sharing `key`; the others wait for its result (or error)."""
+    from concurrent.futures import Future
+
+    with _inflight_lock:
+        future = _inflight.get(key)
+        leader = future is None
+        if leader:
+            future = _inflight[key] = Future()
+    if not leader:
+        return future.result()
+    try:
+        result = fn()
+    except BaseException as exc:
+        future.set_exception(exc)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _inflight_lock:
+            del _inflight[key]
+
+
+def _fetch_my_user_id():
+    import hashlib
+    ck, _, at, _ = _get_creds()
+    key = hashlib.sha256(f"{ck}:{at}".encode()).hexdigest()[:16]
+    user_id = _load_cache(ME_CACHE_FILE).get(key)
+    if not user_id:
+        auth = get_oauth1()
+        resp = _request("GET", f"{API_BASE}/users/me", auth=auth)
+        user_id = _checked_json(resp, "Error getting user")["data"]["id"]
+        _update_cache(ME_CACHE_FILE, key, user_id)
+    return user_id
+
+
 def _get_my_user_id():
-    """Get the authenticated user's ID via OAuth 1.0a. Cached per process."""
+    """Get the authenticated user's ID via OAuth 1.0a.
+
+    Cached per process and on disk (ME_CACHE_FILE), keyed by a hash of the
+    consumer key + access token so rotating credentials invalidates it.
+    Concurrent first calls (bulk) share a single lookup.
+    """
     if not hasattr(_get_my_user_id, "_cached"):
-        import requests
-        auth = get_oauth1()
-        resp = requests.get(f"{API_BASE}/users/me", auth=auth)
-        if not resp.ok:
-            print(f"Error getting user: {resp.status_code} {resp.text}", file=sys.stderr)
-            sys.exit(1)
-        _get_my_user_id._cached = resp.json()["data"]["id"]
+        _get_my_user_id._cached = _singleflight("me", _fetch_my_user_id)
     return _get_my_user_id._cached
 
 
-def _resolve_username(username):
-    """Resolve a @username to a user ID."""
-    import requests
+def _fetch_user_id(target):
+    key = target.lower()
+    entry = _load_cache(USER_CACHE_FILE).get(key)
+    if entry and time.time() - entry.get("ts", 0) < USER_CACHE_TTL:
+        return entry["id"]
+
     auth = get_oauth1()
+    resp = _request("GET", f"{API_BASE}/users/by/username/{target}", auth=auth)
+    user_id = _checked_json(resp, f"Error resolving @{target}")["data"]["id"]
+    _update_cache(USER_CACHE_FILE, key, {"id": user_id, "ts": int(time.time())})
+    return user_id
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_username(username):
+    """Resolve a @username to a user ID.
+
+    Cached per process and on disk (USER_CACHE_FILE) for USER_CACHE_TTL seconds.
+    Concurrent lookups of the same name (bulk) share a single request.
+    """
     target = username.lstrip("@")
-    resp = requests.get(f"{API_BASE}/users/by/username/{target}", auth=auth)
-    if not resp.ok:
-        print(f"Error resolving @{target}: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    return resp.json()["data"]["id"]
+    return _singleflight(("user", target.lower()), lambda: _fetch_user_id(target))
+
+
+def _resolve_me_and_target(username):
+    """Resolve (my user ID, @username's ID) for user-targeted engagement commands.
+
+    Both lookups are usually disk-cache hits; on a miss they run concurrently so
+    at most one round-trip sits in front of the actual write.
+    """
+    with _thread_pool(2) as pool:
+        me_future = pool.submit(_get_my_user_id)
+        target_future = pool.submit(_resolve_username, username)
+        return me_future.result(), target_future.result()
+
+
+# Pulls the user ID out of an XDK response's repr when it has no .data dict
+_ID_PATTERN = re.compile(r"id='?(\d+)")
 
 
 def _get_my_id(client):
@@ -286,9 +848,7 @@ def _get_my_id(client):
     me = client.users.get_me()
     if hasattr(me, 'data') and isinstance(me.data, dict):
         return me.data['id']
-    me_str = str(me)
-    import re
-    match = re.search(r"id='?(\d+)", me_str)
+    match = _ID_PATTERN.search(str(me))
     if not match:
         print("Could not get user ID", file=sys.stderr)
         sys.exit(1)
@@ -297,37 +857,70 @@ def _get_my_id(client):
 
 def _post_tweet(payload: dict) -> dict:
     """Post a tweet using raw requests + OAuth1 (bypasses broken XDK models)."""
-    import requests
     auth = get_oauth1()
-    resp = requests.post(f"{API_BASE}/tweets", json=payload, auth=auth)
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    return resp.json()
+    resp = _request("POST", f"{API_BASE}/tweets", json=payload, auth=auth)
+    return _checked_json(resp)
 
 
 def _delete_tweet(tweet_id: str) -> dict:
     """Delete a tweet using raw requests + OAuth1."""
-    import requests
     auth = get_oauth1()
-    resp = requests.delete(f"{API_BASE}/tweets/{tweet_id}", auth=auth)
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    return resp.json()
+    resp = _request("DELETE", f"{API_BASE}/tweets/{tweet_id}", auth=auth)
+    return _checked_json(resp)
 
 
 def _merge_authors(data):
-    """Merge author info from includes into tweet objects for convenience."""
-    users = {}
-    if "includes" in data and "users" in data["includes"]:
-        users = {u["id"]: u for u in data["includes"]["users"]}
-    for tweet in (data.get("data") or []):
-        author = users.get(tweet.get("author_id", ""), {})
-        tweet["author"] = {"username": author.get("username"), "name": author.get("name")}
+    """Merge author info from includes into tweet objects for convenience.
+
+    data["data"] may be a list of tweets or a single tweet (single-ID lookups).
+    """
+    includes = data.get("includes")
+    if not includes or "users" not in includes:
+        return {}
+    users = {u["id"]: u for u in includes["users"]}
+    get_user = users.get
+    tweets = data.get("data") or ()
+    if isinstance(tweets, dict):
+        tweets = (tweets,)
+    for tweet in tweets:
+        author = get_user(tweet.get("author_id"))
+        if author is not None:
+            tweet["author"] = {"username": author.get("username"), "name": author.get("name")}
     return users
 
 
+def _lookup_batched(path, key, values, params, auth):
+    """GET a v2 batch lookup endpoint for any number of values.
+
+    values are split into LOOKUP_BATCH_SIZE chunks sent as `key=a,b,c`, run
+    concurrently, and merged into one {"data", "includes", "errors"} body.
+    Values the API could not find come back in "errors" rather than failing.
+    """
+    def lookup_batch(batch):
+        resp = _request("GET", f"{API_BASE}{path}", params={key: ",".join(batch), **params}, auth=auth)
+        return _checked_json(resp)
+
+    batches = [values[i : i + LOOKUP_BATCH_SIZE] for i in range(0, len(values), LOOKUP_BATCH_SIZE)]
+    if len(batches) == 1:
+        bodies = [lookup_batch(batches[0])]
+    else:
+        with _thread_pool(4) as pool:
+            bodies = list(pool.map(lookup_batch, batches))
+
+    merged = {"data": [], "includes": {"users": []}, "errors": []}
+    for body in bodies:
+        merged["data"].extend(body.get("data") or ())
+        merged["includes"]["users"].extend(body.get("includes", {}).get("users") or ())
+        merged["errors"].extend(body.get("errors") or ())
+    return merged
+
+
+def _print_lookup_errors(errors):
+    """Report values a batch lookup could not resolve (deleted, suspended, protected…)."""
+    for err in errors:
+        print(f"Warning: {err.get('value', '?')}: {err.get('detail', err.get('title', 'not found'))}", file=sys.stderr)
+
+
 # ── Commands: Post & Reply ──
 
 
@@ -338,7 +931,7 @@ def cmd_tweet(args):
         sys.exit(1)
 
     result = _post_tweet({"text": text})
-    print(json.dumps(result, indent=2, default=str))
+    _emit(result)
 
 
 def cmd_reply(args):
@@ -351,118 +944,139 @@ def cmd_reply(args):
         "text": text,
         "reply": {"in_reply_to_tweet_id": args.tweet_id},
     })
-    print(json.dumps(result, indent=2, default=str))
+    _emit(result)
 
 
 def cmd_delete(args):
     result = _delete_tweet(args.tweet_id)
-    print(json.dumps(result, indent=2, default=str))
+    _emit(result)
 
 
 # ── Commands: Read ──
 
 
 def cmd_get(args):
-    """Fetch a single tweet by ID with author info."""
-    import requests
+    """Fetch tweets by ID with author info; several IDs are looked up in batches of 100."""
     auth = get_oauth1()
-    params = {
-        "tweet.fields": "created_at,author_id,conversation_id,in_reply_to_user_id,text,public_metrics",
-        "expansions": "author_id",
-        "user.fields": "username,name",
-    }
-    resp = requests.get(f"{API_BASE}/tweets/{args.tweet_id}", params=params, auth=auth)
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    data = resp.json()
-    # Merge author info into tweet for convenience
-    if "includes" in data and "users" in data["includes"]:
-        users = {u["id"]: u for u in data["includes"]["users"]}
-        tweet = data.get("data", {})
-        author = users.get(tweet.get("author_id", ""), {})
-        tweet["author"] = {"username": author.get("username"), "name": author.get("name")}
-    print(json.dumps(data.get("data", data), indent=2, default=str))
+    params = {"tweet.fields": TWEET_FIELDS, **AUTHOR_EXPANSION}
+    if len(args.tweet_ids) > 1:
+        data = _lookup_batched("/tweets", "ids", args.tweet_ids, params, auth)
+        _merge_authors(data)
+        _print_lookup_errors(data["errors"])
+        _print_items(data["data"])
+        if not data["data"]:
+            sys.exit(1)
+        return
+    resp = _request("GET", f"{API_BASE}/tweets/{args.tweet_ids[0]}", params=params, auth=auth)
+    data = _checked_json(resp)
+    _merge_authors(data)
+    _emit(data.get("data", data))
 
 
 def cmd_thread(args):
-    """Fetch a conversation thread by tweet ID."""
-    import requests
-    auth = get_oauth1()
-    # First get the tweet to find conversation_id
-    resp = requests.get(
-        f"{API_BASE}/tweets/{args.tweet_id}",
-        params={"tweet.fields": "conversation_id"},
-        auth=auth,
-    )
-    if not resp.ok:
-        print(f"Error fetching tweet: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    tweet_data = resp.json().get("data", {})
-    convo_id = tweet_data.get("conversation_id", args.tweet_id)
+    """Fetch a conversation thread by tweet ID.
 
-    # Search for all tweets in the conversation
+    With --convo-id the tweet lookup is skipped entirely. Otherwise the lookup
+    (for its conversation_id) and the conversation search run concurrently,
+    speculating that the tweet is the conversation root. The search is only
+    re-issued when that guess turns out to be wrong.
+    """
+    auth = get_oauth1()
     n = max(args.n, 10)
-    params = {
-        "query": f"conversation_id:{convo_id}",
-        "tweet.fields": "created_at,author_id,in_reply_to_user_id,text,public_metrics",
-        "expansions": "author_id",
-        "user.fields": "username,name",
-        "max_results": n,
-    }
-    resp = requests.get(f"{API_BASE}/tweets/search/recent", params=params, auth=auth)
-    if not resp.ok:
-        print(f"Error searching thread: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    data = resp.json()
+    params = {"tweet.fields": THREAD_TWEET_FIELDS, **AUTHOR_EXPANSION, "max_results": n}
+
+    def search(convo_id):
+        return _request(
+            "GET",
+            f"{API_BASE}/tweets/search/recent",
+            params={"query": f"conversation_id:{convo_id}", **params},
+            auth=auth,
+        )
+
+    if args.convo_id:
+        data = _checked_json(search(args.convo_id), "Error searching thread")
+        _merge_authors(data)
+        _print_items(data.get("data") or [])
+        return
+
+    with _thread_pool(2) as pool:
+        tweet_future = pool.submit(
+            _request,
+            "GET",
+            f"{API_BASE}/tweets/{args.tweet_id}",
+            params={"tweet.fields": "conversation_id"},
+            auth=auth,
+        )
+        search_future = pool.submit(search, args.tweet_id)
+
+        resp = tweet_future.result()
+        tweet_data = _checked_json(resp, "Error fetching tweet").get("data", {})
+        convo_id = tweet_data.get("conversation_id", args.tweet_id)
+
+        # Search for all tweets in the conversation (reuse the speculative search if it was right)
+        resp = search_future.result() if convo_id == args.tweet_id else search(convo_id)
+
+    data = _checked_json(resp, "Error searching thread")
     _merge_authors(data)
-    for tweet in (data.get("data") or []):
-        print(json.dumps(tweet, indent=2, default=str))
+    _print_items(data.get("data") or [])
 
 
 def cmd_thread_chain(args):
     """Walk an author's full thread chain starting from a tweet.
     Follows the conversation_id and filters to only the original author's tweets,
-    ordered chronologically."""
-    import requests
+    ordered chronologically.
+
+    Like cmd_thread, the conversation search is fired speculatively alongside the
+    tweet lookup and filtered to the author client-side. The precise
+    `from:<author>` search is only needed if the tweet is not the conversation
+    root or the speculative page was truncated."""
     auth = get_oauth1()
-    # Get the starting tweet
-    resp = requests.get(
-        f"{API_BASE}/tweets/{args.tweet_id}",
-        params={
-            "tweet.fields": "conversation_id,author_id,created_at,text,public_metrics",
-            "expansions": "author_id",
-            "user.fields": "username,name",
-        },
-        auth=auth,
-    )
-    if not resp.ok:
-        print(f"Error fetching tweet: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    result = resp.json()
-    tweet_data = result.get("data", {})
-    convo_id = tweet_data.get("conversation_id", args.tweet_id)
-    author_id = tweet_data.get("author_id", "")
-    # Resolve author username
-    users = {}
-    if "includes" in result and "users" in result["includes"]:
-        users = {u["id"]: u for u in result["includes"]["users"]}
-    author_username = users.get(author_id, {}).get("username", "unknown")
-
-    # Search for all tweets in conversation by same author
     n = max(args.n, 10)
     params = {
-        "query": f"conversation_id:{convo_id} from:{author_username}",
-        "tweet.fields": "created_at,author_id,in_reply_to_user_id,text,public_metrics",
+        "tweet.fields": THREAD_TWEET_FIELDS,
         "max_results": n,
         "sort_order": "recency",
     }
-    resp = requests.get(f"{API_BASE}/tweets/search/recent", params=params, auth=auth)
-    if not resp.ok:
-        print(f"Error searching thread: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    data = resp.json()
+
+    def search(query):
+        return _request("GET", f"{API_BASE}/tweets/search/recent", params={"query": query, **params}, auth=auth)
+
+    with _thread_pool(2) as pool:
+        # Get the starting tweet
+        tweet_future = pool.submit(
+            _request,
+            "GET",
+            f"{API_BASE}/tweets/{args.tweet_id}",
+            params={
+                "tweet.fields": "conversation_id,author_id,created_at,text,public_metrics",
+                "expansions": "author_id",
+                "user.fields": "username,name",
+            },
+            auth=auth,
+        )
+        search_future = pool.submit(search, f"conversation_id:{args.tweet_id}")
+
+        resp = tweet_future.result()
+        result = _checked_json(resp, "Error fetching tweet")
+        tweet_data = result.get("data", {})
+        convo_id = tweet_data.get("conversation_id", args.tweet_id)
+        author_id = tweet_data.get("author_id", "")
+        _merge_authors(result)
+        author_username = tweet_data.get("author", {}).get("username") or "unknown"
+
+        resp = search_future.result()
+        speculative = False
+        if convo_id == args.tweet_id and resp.ok:
+            data = _json(resp)
+            speculative = not data.get("meta", {}).get("next_token")
+        if not speculative:
+            # Search for all tweets in conversation by same author
+            resp = search(f"conversation_id:{convo_id} from:{author_username}")
+            data = _checked_json(resp, "Error searching thread")
+
     tweets = data.get("data") or []
+    if speculative:
+        tweets = [t for t in tweets if t.get("author_id") == author_id]
 
     # Add the root tweet if it's not in results (it's the conversation starter)
     root_ids = {t["id"] for t in tweets}
@@ -474,7 +1088,7 @@ def cmd_thread_chain(args):
 
     for tweet in tweets:
         tweet["author"] = {"username": author_username}
-        print(json.dumps(tweet, indent=2, default=str))
+    _print_items(tweets)
 
     if not tweets:
         print(f"No thread found for conversation {convo_id}.", file=sys.stderr)
@@ -482,95 +1096,120 @@ def cmd_thread_chain(args):
 
 def cmd_quotes(args):
     """Fetch quote tweets of a specific tweet."""
-    import requests
     auth = get_oauth1()
     n = max(args.n, 10)
-    params = {
-        "max_results": n,
-        "tweet.fields": "created_at,author_id,text,public_metrics",
-        "expansions": "author_id",
-        "user.fields": "username,name",
-    }
-    resp = requests.get(f"{API_BASE}/tweets/{args.tweet_id}/quote_tweets", params=params, auth=auth)
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    data = resp.json()
+    params = {"max_results": n, **TWEET_PARAMS}
+    resp = _request("GET", f"{API_BASE}/tweets/{args.tweet_id}/quote_tweets", params=params, auth=auth)
+    data = _checked_json(resp)
     _merge_authors(data)
-    for tweet in (data.get("data") or []):
-        print(json.dumps(tweet, indent=2, default=str))
+    _print_items(data.get("data") or [])
     if not data.get("data"):
         print("No quote tweets found.", file=sys.stderr)
 
 
 def cmd_search(args):
     """Search recent tweets (last 7 days)."""
-    import requests
     auth = get_oauth1()
     n = max(args.n, 10)  # API minimum is 10
-    params = {
-        "query": args.query,
-        "max_results": min(n, 100),
-        "tweet.fields": "created_at,author_id,conversation_id,text,public_metrics",
-        "expansions": "author_id",
-        "user.fields": "username,name",
-    }
-    resp = requests.get(f"{API_BASE}/tweets/search/recent", params=params, auth=auth)
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    data = resp.json()
+    params = {"query": args.query, "max_results": min(n, 100), **CONVERSATION_TWEET_PARAMS}
+    resp = _request("GET", f"{API_BASE}/tweets/search/recent", params=params, auth=auth)
+    data = _checked_json(resp)
     _merge_authors(data)
-    for tweet in (data.get("data") or []):
-        print(json.dumps(tweet, indent=2, default=str))
+    _print_items(data.get("data") or [])
     if not data.get("data"):
         print("No results found.", file=sys.stderr)
 
 
+def _pack_queries(queries, max_len):
+    """Greedily OR-join queries into as few search queries as fit within max_len chars."""
+    batches, current = [], ""
+    for query in queries:
+        term = f"({query})"
+        if len(term) > max_len:
+            print(f"Error: Query is {len(term)} chars (max {max_len}): {query}", file=sys.stderr)
+            sys.exit(1)
+        if current and len(current) + len(" OR ") + len(term) > max_len:
+            batches.append(current)
+            current = term
+        else:
+            current = f"{current} OR {term}" if current else term
+    if current:
+        batches.append(current)
+    return batches
+
+
+def cmd_search_many(args):
+    """Run many searches from a file, OR-packing them into as few requests as the query cap allows."""
+    try:
+        f = sys.stdin if args.file == "-" else open(args.file, encoding="utf-8")
+    except OSError as e:
+        print(f"Error: Cannot read {args.file}: {e.strerror}", file=sys.stderr)
+        sys.exit(1)
+    with f:
+        queries = [q for q in (line.strip() for line in f) if q and not q.startswith("#")]
+    if not queries:
+        print("Error: No queries found", file=sys.stderr)
+        sys.exit(1)
+
+    n = max(args.n, 10)
+    if args.all:
+        url, max_len, max_results = f"{API_BASE}/tweets/search/all", SEARCH_ALL_QUERY_MAX_LEN, min(n, 500)
+        auth_kwargs = {"headers": _bearer_headers()}
+    else:
+        url, max_len, max_results = f"{API_BASE}/tweets/search/recent", SEARCH_QUERY_MAX_LEN, min(n, 100)
+        auth_kwargs = {"auth": get_oauth1()}
+
+    def search(query):
+        params = {"query": query, "max_results": max_results, **CONVERSATION_TWEET_PARAMS}
+        resp = _request("GET", url, params=params, **auth_kwargs)
+        data = _checked_json(resp, pro_feature="Full-archive search" if args.all else None)
+        _merge_authors(data)
+        return data.get("data") or []
+
+    batches = _pack_queries(queries, max_len)
+    print(f"search-many: {len(queries)} queries in {len(batches)} request(s)", file=sys.stderr)
+    if len(batches) == 1:
+        results = [search(batches[0])]
+    else:
+        with _thread_pool(4) as pool:
+            results = list(pool.map(search, batches))
+
+    seen = set()
+    tweets = []
+    for batch in results:
+        for tweet in batch:
+            if tweet["id"] not in seen:
+                seen.add(tweet["id"])
+                tweets.append(tweet)
+    _print_items(tweets)
+    if not tweets:
+        print("No results found.", file=sys.stderr)
+
+
 def cmd_mentions(args):
     """Get your recent mentions."""
-    import requests
     auth = get_oauth1()
     user_id = _get_my_user_id()
     n = max(args.n, 5)
-    params = {
-        "max_results": min(n, 100),
-        "tweet.fields": "created_at,author_id,conversation_id,text,public_metrics",
-        "expansions": "author_id",
-        "user.fields": "username,name",
-    }
-    resp = requests.get(f"{API_BASE}/users/{user_id}/mentions", params=params, auth=auth)
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    data = resp.json()
+    params = {"max_results": min(n, 100), **CONVERSATION_TWEET_PARAMS}
+    resp = _request("GET", f"{API_BASE}/users/{user_id}/mentions", params=params, auth=auth)
+    data = _checked_json(resp)
     _merge_authors(data)
-    for tweet in (data.get("data") or []):
-        print(json.dumps(tweet, indent=2, default=str))
+    _print_items(data.get("data") or [])
     if not data.get("data"):
         print("No mentions found.", file=sys.stderr)
 
 
 def cmd_timeline(args):
     """Get your home timeline."""
-    import requests
     auth = get_oauth1()
     user_id = _get_my_user_id()
     n = max(args.n, 5)
-    params = {
-        "max_results": min(n, 100),
-        "tweet.fields": "created_at,author_id,conversation_id,text,public_metrics",
-        "expansions": "author_id",
-        "user.fields": "username,name",
-    }
-    resp = requests.get(f"{API_BASE}/users/{user_id}/timelines/reverse_chronological", params=params, auth=auth)
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    data = resp.json()
+    params = {"max_results": min(n, 100), **CONVERSATION_TWEET_PARAMS}
+    resp = _request("GET", f"{API_BASE}/users/{user_id}/timelines/reverse_chronological", params=params, auth=auth)
+    data = _checked_json(resp)
     _merge_authors(data)
-    for tweet in (data.get("data") or []):
-        print(json.dumps(tweet, indent=2, default=str))
+    _print_items(data.get("data") or [])
     if not data.get("data"):
         print("No timeline tweets found.", file=sys.stderr)
 
@@ -580,43 +1219,41 @@ def cmd_timeline(args):
 
 def cmd_user(args):
     """Look up a user's profile by username."""
-    import requests
     auth = get_oauth1()
     target = args.username.lstrip("@")
-    params = {
-        "user.fields": "created_at,description,location,public_metrics,verified,url,pinned_tweet_id",
-    }
-    resp = requests.get(f"{API_BASE}/users/by/username/{target}", params=params, auth=auth)
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
+    params = {"user.fields": USER_PROFILE_FIELDS}
+    resp = _request("GET", f"{API_BASE}/users/by/username/{target}", params=params, auth=auth)
+    result = _checked_json(resp)
+    data = result.get("data", result)
+    _emit(data)
+
+
+def cmd_users(args):
+    """Look up several users' profiles by username, up to 100 per request."""
+    auth = get_oauth1()
+    usernames = [name.lstrip("@") for name in args.usernames]
+    data = _lookup_batched("/users/by", "usernames", usernames, {"user.fields": USER_PROFILE_FIELDS}, auth)
+    _print_lookup_errors(data["errors"])
+    _print_items(data["data"])
+    if not data["data"]:
         sys.exit(1)
-    data = resp.json().get("data", resp.json())
-    print(json.dumps(data, indent=2, default=str))
 
 
 def cmd_user_timeline(args):
     """Fetch recent tweets from a specific user."""
-    import requests
     auth = get_oauth1()
     target = args.username.lstrip("@")
     user_id = _resolve_username(target)
     # Fetch their tweets
     n = max(args.n, 5)
-    params = {
-        "max_results": n,
-        "tweet.fields": "created_at,author_id,conversation_id,in_reply_to_user_id,text,public_metrics",
-        "exclude": "retweets" if not args.include_rts else "",
-    }
-    if not params["exclude"]:
-        del params["exclude"]
-    resp = requests.get(f"{API_BASE}/users/{user_id}/tweets", params=params, auth=auth)
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    data = resp.json()
+    params = {"max_results": n, "tweet.fields": TWEET_FIELDS}
+    if not args.include_rts:
+        params["exclude"] = "retweets"
+    resp = _request("GET", f"{API_BASE}/users/{user_id}/tweets", params=params, auth=auth)
+    data = _checked_json(resp)
     for tweet in (data.get("data") or []):
         tweet["author"] = {"username": target}
-        print(json.dumps(tweet, indent=2, default=str))
+    _print_items(data.get("data") or [])
     if not data.get("data"):
         print(f"No tweets found for @{target}.", file=sys.stderr)
 
@@ -626,105 +1263,75 @@ def cmd_user_timeline(args):
 
 def cmd_followers(args):
     """List followers of a user."""
-    import requests
     auth = get_oauth1()
     target = args.username.lstrip("@")
     user_id = _resolve_username(target)
     n = min(max(args.n, 1), 1000)
     params = {
         "max_results": n,
-        "user.fields": "username,name,public_metrics,description,verified",
+        "user.fields": FOLLOW_USER_FIELDS,
     }
-    resp = requests.get(f"{API_BASE}/users/{user_id}/followers", params=params, auth=auth)
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    data = resp.json()
-    for user in (data.get("data") or []):
-        print(json.dumps(user, indent=2, default=str))
+    resp = _request("GET", f"{API_BASE}/users/{user_id}/followers", params=params, auth=auth)
+    data = _checked_json(resp)
+    _print_items(data.get("data") or [])
     if not data.get("data"):
         print(f"No followers found for @{target}.", file=sys.stderr)
 
 
 def cmd_following(args):
     """List users that a user is following."""
-    import requests
     auth = get_oauth1()
     target = args.username.lstrip("@")
     user_id = _resolve_username(target)
     n = min(max(args.n, 1), 1000)
     params = {
         "max_results": n,
-        "user.fields": "username,name,public_metrics,description,verified",
+        "user.fields": FOLLOW_USER_FIELDS,
     }
-    resp = requests.get(f"{API_BASE}/users/{user_id}/following", params=params, auth=auth)
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    data = resp.json()
-    for user in (data.get("data") or []):
-        print(json.dumps(user, indent=2, default=str))
+    resp = _request("GET", f"{API_BASE}/users/{user_id}/following", params=params, auth=auth)
+    data = _checked_json(resp)
+    _print_items(data.get("data") or [])
     if not data.get("data"):
         print(f"@{target} is not following anyone.", file=sys.stderr)
 
 
 def cmd_liked(args):
     """List tweets liked by a user."""
-    import requests
     auth = get_oauth1()
     target = args.username.lstrip("@")
     user_id = _resolve_username(target)
     n = min(max(args.n, 5), 100)
-    params = {
-        "max_results": n,
-        "tweet.fields": "created_at,author_id,text,public_metrics",
-        "expansions": "author_id",
-        "user.fields": "username,name",
-    }
-    resp = requests.get(f"{API_BASE}/users/{user_id}/liked_tweets", params=params, auth=auth)
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    data = resp.json()
+    params = {"max_results": n, **TWEET_PARAMS}
+    resp = _request("GET", f"{API_BASE}/users/{user_id}/liked_tweets", params=params, auth=auth)
+    data = _checked_json(resp)
     _merge_authors(data)
-    for tweet in (data.get("data") or []):
-        print(json.dumps(tweet, indent=2, default=str))
+    _print_items(data.get("data") or [])
     if not data.get("data"):
         print(f"No liked tweets found for @{target}.", file=sys.stderr)
 
 
 def cmd_liking_users(args):
     """List users who liked a tweet."""
-    import requests
     auth = get_oauth1()
     params = {
-        "user.fields": "username,name,public_metrics,verified",
+        "user.fields": ENGAGER_USER_FIELDS,
     }
-    resp = requests.get(f"{API_BASE}/tweets/{args.tweet_id}/liking_users", params=params, auth=auth)
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    data = resp.json()
-    for user in (data.get("data") or []):
-        print(json.dumps(user, indent=2, default=str))
+    resp = _request("GET", f"{API_BASE}/tweets/{args.tweet_id}/liking_users", params=params, auth=auth)
+    data = _checked_json(resp)
+    _print_items(data.get("data") or [])
     if not data.get("data"):
         print("No liking users found.", file=sys.stderr)
 
 
 def cmd_retweeters(args):
     """List users who retweeted a tweet."""
-    import requests
     auth = get_oauth1()
     params = {
-        "user.fields": "username,name,public_metrics,verified",
+        "user.fields": ENGAGER_USER_FIELDS,
     }
-    resp = requests.get(f"{API_BASE}/tweets/{args.tweet_id}/retweeted_by", params=params, auth=auth)
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    data = resp.json()
-    for user in (data.get("data") or []):
-        print(json.dumps(user, indent=2, default=str))
+    resp = _request("GET", f"{API_BASE}/tweets/{args.tweet_id}/retweeted_by", params=params, auth=auth)
+    data = _checked_json(resp)
+    _print_items(data.get("data") or [])
     if not data.get("data"):
         print("No retweeters found.", file=sys.stderr)
 
@@ -734,88 +1341,65 @@ def cmd_retweeters(args):
 
 def cmd_like(args):
     """Like a tweet."""
-    import requests
     auth = get_oauth1()
     user_id = _get_my_user_id()
-    resp = requests.post(
+    resp = _request(
+        "POST",
         f"{API_BASE}/users/{user_id}/likes",
         json={"tweet_id": args.tweet_id},
         auth=auth,
     )
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    print(json.dumps(resp.json(), indent=2, default=str))
+    _emit(_checked_json(resp))
 
 
 def cmd_unlike(args):
     """Unlike a tweet."""
-    import requests
     auth = get_oauth1()
     user_id = _get_my_user_id()
-    resp = requests.delete(f"{API_BASE}/users/{user_id}/likes/{args.tweet_id}", auth=auth)
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    print(json.dumps(resp.json(), indent=2, default=str))
+    resp = _request("DELETE", f"{API_BASE}/users/{user_id}/likes/{args.tweet_id}", auth=auth)
+    _emit(_checked_json(resp))
 
 
 def cmd_follow(args):
     """Follow a user by username."""
-    import requests
     auth = get_oauth1()
-    user_id = _get_my_user_id()
-    target_id = _resolve_username(args.username)
-    resp = requests.post(
+    user_id, target_id = _resolve_me_and_target(args.username)
+    resp = _request(
+        "POST",
         f"{API_BASE}/users/{user_id}/following",
         json={"target_user_id": target_id},
         auth=auth,
     )
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    print(json.dumps(resp.json(), indent=2, default=str))
+    _emit(_checked_json(resp))
 
 
 def cmd_unfollow(args):
     """Unfollow a user by username."""
-    import requests
     auth = get_oauth1()
-    user_id = _get_my_user_id()
-    target_id = _resolve_username(args.username)
-    resp = requests.delete(f"{API_BASE}/users/{user_id}/following/{target_id}", auth=auth)
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    print(json.dumps(resp.json(), indent=2, default=str))
+    user_id, target_id = _resolve_me_and_target(args.username)
+    resp = _request("DELETE", f"{API_BASE}/users/{user_id}/following/{target_id}", auth=auth)
+    _emit(_checked_json(resp))
 
 
 def cmd_retweet(args):
     """Retweet a tweet."""
-    import requests
     auth = get_oauth1()
     user_id = _get_my_user_id()
-    resp = requests.post(
+    resp = _request(
+        "POST",
         f"{API_BASE}/users/{user_id}/retweets",
         json={"tweet_id": args.tweet_id},
         auth=auth,
     )
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    print(json.dumps(resp.json(), indent=2, default=str))
+    _emit(_checked_json(resp))
 
 
 def cmd_unretweet(args):
     """Undo a retweet."""
-    import requests
     auth = get_oauth1()
     user_id = _get_my_user_id()
-    resp = requests.delete(f"{API_BASE}/users/{user_id}/retweets/{args.tweet_id}", auth=auth)
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    print(json.dumps(resp.json(), indent=2, default=str))
+    resp = _request("DELETE", f"{API_BASE}/users/{user_id}/retweets/{args.tweet_id}", auth=auth)
+    _emit(_checked_json(resp))
 
 
 # ── Commands: Moderate (mute/block) ──
@@ -823,62 +1407,44 @@ def cmd_unretweet(args):
 
 def cmd_mute(args):
     """Mute a user by username."""
-    import requests
     auth = get_oauth1()
-    user_id = _get_my_user_id()
-    target_id = _resolve_username(args.username)
-    resp = requests.post(
+    user_id, target_id = _resolve_me_and_target(args.username)
+    resp = _request(
+        "POST",
         f"{API_BASE}/users/{user_id}/muting",
         json={"target_user_id": target_id},
         auth=auth,
     )
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    print(json.dumps(resp.json(), indent=2, default=str))
+    _emit(_checked_json(resp))
 
 
 def cmd_unmute(args):
     """Unmute a user by username."""
-    import requests
     auth = get_oauth1()
-    user_id = _get_my_user_id()
-    target_id = _resolve_username(args.username)
-    resp = requests.delete(f"{API_BASE}/users/{user_id}/muting/{target_id}", auth=auth)
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    print(json.dumps(resp.json(), indent=2, default=str))
+    user_id, target_id = _resolve_me_and_target(args.username)
+    resp = _request("DELETE", f"{API_BASE}/users/{user_id}/muting/{target_id}", auth=auth)
+    _emit(_checked_json(resp))
 
 
 def cmd_block(args):
     """Block a user by username."""
-    import requests
     auth = get_oauth1()
-    user_id = _get_my_user_id()
-    target_id = _resolve_username(args.username)
-    resp = requests.post(
+    user_id, target_id = _resolve_me_and_target(args.username)
+    resp = _request(
+        "POST",
         f"{API_BASE}/users/{user_id}/blocking",
         json={"target_user_id": target_id},
         auth=auth,
     )
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    print(json.dumps(resp.json(), indent=2, default=str))
+    _emit(_checked_json(resp))
 
 
 def cmd_unblock(args):
     """Unblock a user by username."""
-    import requests
     auth = get_oauth1()
-    user_id = _get_my_user_id()
-    target_id = _resolve_username(args.username)
-    resp = requests.delete(f"{API_BASE}/users/{user_id}/blocking/{target_id}", auth=auth)
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    print(json.dumps(resp.json(), indent=2, default=str))
+    user_id, target_id = _resolve_me_and_target(args.username)
+    resp = _request("DELETE", f"{API_BASE}/users/{user_id}/blocking/{target_id}", auth=auth)
+    _emit(_checked_json(resp))
 
 
 # ── Commands: Hide Replies ──
@@ -886,32 +1452,26 @@ def cmd_unblock(args):
 
 def cmd_hide(args):
     """Hide a reply to one of your tweets."""
-    import requests
     auth = get_oauth1()
-    resp = requests.put(
+    resp = _request(
+        "PUT",
         f"{API_BASE}/tweets/{args.tweet_id}/hidden",
         json={"hidden": True},
         auth=auth,
     )
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    print(json.dumps(resp.json(), indent=2, default=str))
+    _emit(_checked_json(resp))
 
 
 def cmd_unhide(args):
     """Unhide a reply to one of your tweets."""
-    import requests
     auth = get_oauth1()
-    resp = requests.put(
+    resp = _request(
+        "PUT",
         f"{API_BASE}/tweets/{args.tweet_id}/hidden",
         json={"hidden": False},
         auth=auth,
     )
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    print(json.dumps(resp.json(), indent=2, default=str))
+    _emit(_checked_json(resp))
 
 
 # ── Commands: Direct Messages ──
@@ -919,60 +1479,48 @@ def cmd_unhide(args):
 
 def cmd_dm(args):
     """Send a direct message to a user."""
-    import requests
     auth = get_oauth1()
     target_id = _resolve_username(args.username)
     payload = {"text": args.text}
-    resp = requests.post(
+    resp = _request(
+        "POST",
         f"{API_BASE}/dm_conversations/with/{target_id}/messages",
         json=payload,
         auth=auth,
     )
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    print(json.dumps(resp.json(), indent=2, default=str))
+    _emit(_checked_json(resp))
 
 
 def cmd_dm_list(args):
     """List recent DM events."""
-    import requests
     auth = get_oauth1()
     n = min(max(args.n, 1), 100)
     params = {
         "max_results": n,
-        "dm_event.fields": "id,text,event_type,created_at,sender_id,dm_conversation_id,attachments",
+        "dm_event.fields": DM_EVENT_FIELDS,
     }
-    resp = requests.get(f"{API_BASE}/dm_events", params=params, auth=auth)
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    data = resp.json()
-    for event in (data.get("data") or []):
-        print(json.dumps(event, indent=2, default=str))
+    resp = _request("GET", f"{API_BASE}/dm_events", params=params, auth=auth)
+    data = _checked_json(resp)
+    _print_items(data.get("data") or [])
     if not data.get("data"):
         print("No DM events found.", file=sys.stderr)
 
 
 def cmd_dm_conversation(args):
     """List DM events in a specific conversation."""
-    import requests
     auth = get_oauth1()
     n = min(max(args.n, 1), 100)
     params = {
         "max_results": n,
-        "dm_event.fields": "id,text,event_type,created_at,sender_id,dm_conversation_id,attachments",
+        "dm_event.fields": DM_EVENT_FIELDS,
     }
-    resp = requests.get(
+    resp = _request(
+        "GET",
         f"{API_BASE}/dm_conversations/{args.conversation_id}/dm_events",
         params=params, auth=auth,
     )
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    data = resp.json()
-    for event in (data.get("data") or []):
-        print(json.dumps(event, indent=2, default=str))
+    data = _checked_json(resp)
+    _print_items(data.get("data") or [])
     if not data.get("data"):
         print("No DM events found in this conversation.", file=sys.stderr)
 
@@ -982,76 +1530,33 @@ def cmd_dm_conversation(args):
 
 def cmd_verify(args):
     """Verify OAuth 1.0a credentials work."""
-    import requests
     auth = get_oauth1()
-    resp = requests.get(f"{API_BASE}/users/me", auth=auth)
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    data = resp.json().get("data", {})
+    resp = _request("GET", f"{API_BASE}/users/me", auth=auth)
+    data = _checked_json(resp).get("data", {})
     print(f"Authenticated as: @{data.get('username')} ({data.get('name')})")
 
 
 def cmd_me(args):
     """Get your own profile info."""
-    import requests
     auth = get_oauth1()
     params = {
         "user.fields": "id,username,name,description,location,url,created_at,public_metrics,verified",
     }
-    resp = requests.get(f"{API_BASE}/users/me", params=params, auth=auth)
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    print(json.dumps(resp.json().get("data", {}), indent=2, default=str))
+    resp = _request("GET", f"{API_BASE}/users/me", params=params, auth=auth)
+    _emit(_checked_json(resp).get("data", {}))
 
 
 def cmd_profile(args):
     """Update profile bio — uses v1.1 API (XDK doesn't cover this)."""
-    import hashlib
-    import hmac
-    import base64
-    import time
-    import urllib.parse
-    import urllib.request
-
-    ck, cs, at, ats = _get_creds()
-
-    url = "https://api.twitter.com/1.1/account/update_profile.json"
-    params = {"description": args.text}
-
-    oauth = {
-        "oauth_consumer_key": ck,
-        "oauth_nonce": hashlib.md5(str(time.time()).encode()).hexdigest(),
-        "oauth_signature_method": "HMAC-SHA1",
-        "oauth_timestamp": str(int(time.time())),
-        "oauth_token": at,
-        "oauth_version": "1.0",
-    }
-    all_params = {**oauth, **params}
-    sorted_params = "&".join(
-        f'{urllib.parse.quote(k, safe="")}'
-        f'={urllib.parse.quote(str(v), safe="")}'
-        for k, v in sorted(all_params.items())
-    )
-    base_string = f'POST&{urllib.parse.quote(url, safe="")}&{urllib.parse.quote(sorted_params, safe="")}'
-    signing_key = f'{urllib.parse.quote(cs, safe="")}&{urllib.parse.quote(ats, safe="")}'
-    sig = base64.b64encode(
-        hmac.new(signing_key.encode(), base_string.encode(), hashlib.sha1).digest()
-    ).decode()
-    oauth["oauth_signature"] = sig
-    auth_header = "OAuth " + ", ".join(
-        f'{k}="{urllib.parse.quote(v, safe="")}"' for k, v in sorted(oauth.items())
-    )
-
-    data = urllib.parse.urlencode(params).encode()
-    req = urllib.request.Request(
-        url, data=data, method="POST",
-        headers={"Authorization": auth_header, "Content-Type": "application/x-www-form-urlencoded"},
+    auth = get_oauth1()
+    resp = _request(
+        "POST",
+        "https://api.twitter.com/1.1/account/update_profile.json",
+        data={"description": args.text},
+        auth=auth,
     )
-    with urllib.request.urlopen(req) as resp:
-        result = json.loads(resp.read())
-        print(f"Bio updated: {result['description']}")
+    result = _checked_json(resp)
+    print(f"Bio updated: {result['description']}")
 
 
 # ── Commands: OAuth 2.0 PKCE Auth ──
@@ -1062,20 +1567,17 @@ def cmd_auth(args):
     import base64
     import hashlib
     import secrets
-    import time
     import webbrowser
     from http.server import HTTPServer, BaseHTTPRequestHandler
     from urllib.parse import urlencode, urlparse, parse_qs
-    import requests
 
     client_id = _get_client_id()
     client_secret = _get_client_secret()
 
     # Generate PKCE parameters
-    code_verifier = secrets.token_urlsafe(96)[:128]
-    code_challenge = base64.urlsafe_b64encode(
-        hashlib.sha256(code_verifier.encode()).digest()
-    ).rstrip(b"=").decode()
+    code_verifier = secrets.token_urlsafe(64)  # 86 URL-safe chars, within RFC 7636's 43-128
+    digest = hashlib.sha256(code_verifier.encode("ascii")).digest()
+    code_challenge = base64.urlsafe_b64encode(digest).rstrip(b"=").decode("ascii")
     state = secrets.token_urlsafe(32)
 
     redirect_uri = "http://127.0.0.1:8017/callback"
@@ -1152,12 +1654,8 @@ def cmd_auth(args):
     if client_secret:
         token_auth = (client_id, client_secret)
 
-    resp = requests.post("https://api.x.com/2/oauth2/token", data=token_data, auth=token_auth)
-    if not resp.ok:
-        print(f"Error exchanging code for token: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-
-    result = resp.json()
+    resp = _request("POST", "https://api.x.com/2/oauth2/token", data=token_data, auth=token_auth)
+    result = _checked_json(resp, "Error exchanging code for token")
     tokens = {
         "access_token": result["access_token"],
         "refresh_token": result.get("refresh_token", ""),
@@ -1172,14 +1670,12 @@ def cmd_auth(args):
 # ── Commands: Bookmarks (OAuth 2.0 PKCE) ──
 
 
-def _enrich_tweets_oauth2(tweets, headers):
+def _enrich_tweets_oauth2(tweets):
     """Fetch full tweet details for tweets that are missing text (e.g. from bookmarks).
 
     Uses the OAuth 2.0 token to do a batch /2/tweets lookup and merges text,
     author info, and metrics back into the original tweet objects.
     """
-    import requests
-
     if not tweets:
         return tweets
 
@@ -1187,19 +1683,24 @@ def _enrich_tweets_oauth2(tweets, headers):
     if not ids_missing_text:
         return tweets  # all tweets already have text
 
-    # Batch lookup — /2/tweets accepts up to 100 IDs per request
+    # Batch lookup — /2/tweets accepts up to 100 IDs per request; batches run concurrently
+    def lookup_batch(batch):
+        params = {"ids": ",".join(batch), **TWEET_PARAMS}
+        return _oauth2_request("GET", f"{API_BASE}/tweets", params=params)
+
+    batches = [
+        ids_missing_text[i : i + LOOKUP_BATCH_SIZE] for i in range(0, len(ids_missing_text), LOOKUP_BATCH_SIZE)
+    ]
+    if len(batches) == 1:
+        responses = [lookup_batch(batches[0])]
+    else:
+        with _thread_pool(4) as pool:
+            responses = list(pool.map(lookup_batch, batches))
+
     full_map = {}
-    for i in range(0, len(ids_missing_text), 100):
-        batch = ids_missing_text[i : i + 100]
-        params = {
-            "ids": ",".join(batch),
-            "tweet.fields": "created_at,author_id,text,public_metrics",
-            "expansions": "author_id",
-            "user.fields": "username,name",
-        }
-        resp = requests.get(f"{API_BASE}/tweets", params=params, headers=headers)
+    for resp in responses:
         if resp.ok:
-            lookup = resp.json()
+            lookup = _json(resp)
             _merge_authors(lookup)
             for t in (lookup.get("data") or []):
                 full_map[t["id"]] = t
@@ -1214,80 +1715,42 @@ def _enrich_tweets_oauth2(tweets, headers):
 
 def cmd_bookmarks(args):
     """List bookmarked tweets."""
-    import requests
-
-    # Get user ID via OAuth 2.0 (use /2/users/me with PKCE token)
-    headers = _oauth2_headers()
-    me_resp = requests.get(f"{API_BASE}/users/me", headers=headers)
-    if not me_resp.ok:
-        print(f"Error getting user: {me_resp.status_code} {me_resp.text}", file=sys.stderr)
-        sys.exit(1)
-    user_id = me_resp.json()["data"]["id"]
+    user_id = _get_pkce_user_id()
 
     n = max(args.n, 1)
-    params = {
-        "max_results": min(n, 100),
-        "tweet.fields": "created_at,author_id,text,public_metrics",
-        "expansions": "author_id",
-        "user.fields": "username,name",
-    }
-    resp = requests.get(f"{API_BASE}/users/{user_id}/bookmarks", params=params, headers=headers)
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    data = resp.json()
+    params = {"max_results": min(n, 100), **TWEET_PARAMS}
+    resp = _oauth2_request("GET", f"{API_BASE}/users/{user_id}/bookmarks", params=params)
+    data = _checked_json(resp)
     _merge_authors(data)
     tweets = data.get("data") or []
     # Enrich tweets that may be missing text (API sometimes returns only IDs)
-    _enrich_tweets_oauth2(tweets, headers)
-    for tweet in tweets:
-        print(json.dumps(tweet, indent=2, default=str))
+    _enrich_tweets_oauth2(tweets)
+    _print_items(tweets)
     if not tweets:
         print("No bookmarks found.", file=sys.stderr)
 
 
 def cmd_bookmark(args):
     """Bookmark a tweet."""
-    import requests
-
-    headers = _oauth2_headers()
-    headers["Content-Type"] = "application/json"
-    me_resp = requests.get(f"{API_BASE}/users/me", headers=_oauth2_headers())
-    if not me_resp.ok:
-        print(f"Error getting user: {me_resp.status_code} {me_resp.text}", file=sys.stderr)
-        sys.exit(1)
-    user_id = me_resp.json()["data"]["id"]
+    user_id = _get_pkce_user_id()
 
-    resp = requests.post(
+    resp = _oauth2_request(
+        "POST",
         f"{API_BASE}/users/{user_id}/bookmarks",
         json={"tweet_id": args.tweet_id},
-        headers=headers,
     )
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    print(json.dumps(resp.json(), indent=2, default=str))
+    _emit(_checked_json(resp))
 
 
 def cmd_unbookmark(args):
     """Remove a bookmark."""
-    import requests
-
-    headers = _oauth2_headers()
-    me_resp = requests.get(f"{API_BASE}/users/me", headers=headers)
-    if not me_resp.ok:
-        print(f"Error getting user: {me_resp.status_code} {me_resp.text}", file=sys.stderr)
-        sys.exit(1)
-    user_id = me_resp.json()["data"]["id"]
+    user_id = _get_pkce_user_id()
 
-    resp = requests.delete(
+    resp = _oauth2_request(
+        "DELETE",
         f"{API_BASE}/users/{user_id}/bookmarks/{args.tweet_id}",
-        headers=headers,
     )
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    print(json.dumps(resp.json(), indent=2, default=str))
+    _emit(_checked_json(resp))
 
 
 # ── Commands: Bookmark Folders (OAuth 2.0 PKCE) ──
@@ -1295,55 +1758,31 @@ def cmd_unbookmark(args):
 
 def cmd_bookmark_folders(args):
     """List bookmark folders."""
-    import requests
-    headers = _oauth2_headers()
-    me_resp = requests.get(f"{API_BASE}/users/me", headers=headers)
-    if not me_resp.ok:
-        print(f"Error getting user: {me_resp.status_code} {me_resp.text}", file=sys.stderr)
-        sys.exit(1)
-    user_id = me_resp.json()["data"]["id"]
+    user_id = _get_pkce_user_id()
 
-    resp = requests.get(f"{API_BASE}/users/{user_id}/bookmarks/folders", headers=headers)
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    data = resp.json()
-    for folder in (data.get("data") or []):
-        print(json.dumps(folder, indent=2, default=str))
+    resp = _oauth2_request("GET", f"{API_BASE}/users/{user_id}/bookmarks/folders")
+    data = _checked_json(resp)
+    _print_items(data.get("data") or [])
     if not data.get("data"):
         print("No bookmark folders found.", file=sys.stderr)
 
 
 def cmd_bookmarks_folder(args):
     """List bookmarks in a specific folder."""
-    import requests
-    headers = _oauth2_headers()
-    me_resp = requests.get(f"{API_BASE}/users/me", headers=headers)
-    if not me_resp.ok:
-        print(f"Error getting user: {me_resp.status_code} {me_resp.text}", file=sys.stderr)
-        sys.exit(1)
-    user_id = me_resp.json()["data"]["id"]
+    user_id = _get_pkce_user_id()
 
     n = max(args.n, 1)
-    params = {
-        "max_results": min(n, 100),
-        "tweet.fields": "created_at,author_id,text,public_metrics",
-        "expansions": "author_id",
-        "user.fields": "username,name",
-    }
-    resp = requests.get(
+    params = {"max_results": min(n, 100), **TWEET_PARAMS}
+    resp = _oauth2_request(
+        "GET",
         f"{API_BASE}/users/{user_id}/bookmarks/folders/{args.folder_id}",
-        params=params, headers=headers,
+        params=params,
     )
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    data = resp.json()
+    data = _checked_json(resp)
     _merge_authors(data)
     tweets = data.get("data") or []
-    _enrich_tweets_oauth2(tweets, headers)
-    for tweet in tweets:
-        print(json.dumps(tweet, indent=2, default=str))
+    _enrich_tweets_oauth2(tweets)
+    _print_items(tweets)
     if not tweets:
         print("No bookmarks found in this folder.", file=sys.stderr)
 
@@ -1351,99 +1790,122 @@ def cmd_bookmarks_folder(args):
 # ── Commands: Filtered Stream (Bearer Token, Pro access) ──
 
 
+def _write_fd(fd, data):
+    """Write all of data to a file descriptor, looping over partial writes."""
+    with memoryview(data) as view:
+        while view:
+            view = view[os.write(fd, view):]
+
+
+def _print_stream(resp, n):
+    """Print up to n tweets from a streaming response, then close it.
+
+    Each line is parsed from raw bytes and serialized back to bytes, so tweets
+    never round-trip through str. Records are batched and written straight to
+    the stdout file descriptor every STREAM_FLUSH_RECORDS records or
+    STREAM_FLUSH_BYTES bytes, and whenever the server sends a keep-alive, so a
+    quiet stream still shows what it has. Malformed lines are skipped; Ctrl-C
+    stops cleanly.
+    """
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        fd = None  # captured/redirected stdout: fall back to normal writes
+    buf = bytearray()
+    pending = 0
+
+    def flush():
+        nonlocal pending
+        if not buf:
+            return
+        if fd is None:
+            _write(bytes(buf))
+        else:
+            sys.stdout.flush()  # anything already printed goes first
+            _write_fd(fd, buf)
+        buf.clear()
+        pending = 0
+
+    count = 0
+    try:
+        for line in resp.iter_lines():
+            if not line:
+                flush()  # keep-alive: the stream is idle, hand over what we have
+                continue
+            try:
+                tweet_data = _loads(line)
+            except json.JSONDecodeError:
+                continue
+            buf += _dumpb(tweet_data)
+            buf += b"\n"
+            pending += 1
+            count += 1
+            if count >= n:
+                break
+            if pending >= STREAM_FLUSH_RECORDS or len(buf) >= STREAM_FLUSH_BYTES:
+                flush()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        flush()
+        resp.close()
+
+
 def cmd_stream_rules_add(args):
     """Add a rule to the filtered stream."""
-    import requests
-
     rule = {"value": args.rule}
     if args.tag:
         rule["tag"] = args.tag
 
-    resp = requests.post(
+    resp = _request(
+        "POST",
         f"{API_BASE}/tweets/search/stream/rules",
         json={"add": [rule]},
         headers=_bearer_headers(),
     )
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    print(json.dumps(resp.json(), indent=2, default=str))
+    _emit(_checked_json(resp))
 
 
 def cmd_stream_rules_list(args):
     """List all filtered stream rules."""
-    import requests
-
-    resp = requests.get(
+    resp = _request(
+        "GET",
         f"{API_BASE}/tweets/search/stream/rules",
         headers=_bearer_headers(),
     )
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    data = resp.json()
+    data = _checked_json(resp)
     rules = data.get("data") or []
     if not rules:
         print("No stream rules configured.", file=sys.stderr)
     else:
-        for rule in rules:
-            print(json.dumps(rule, indent=2, default=str))
+        _print_items(rules)
 
 
 def cmd_stream_rules_delete(args):
     """Delete a filtered stream rule by ID."""
-    import requests
-
-    resp = requests.post(
+    resp = _request(
+        "POST",
         f"{API_BASE}/tweets/search/stream/rules",
         json={"delete": {"ids": [args.rule_id]}},
         headers=_bearer_headers(),
     )
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    print(json.dumps(resp.json(), indent=2, default=str))
+    _emit(_checked_json(resp))
 
 
 def cmd_stream_filter(args):
     """Connect to filtered stream and collect tweets (Pro access required)."""
-    import requests
-
     n = args.n
-    params = {
-        "tweet.fields": "created_at,author_id,text,public_metrics",
-        "expansions": "author_id",
-        "user.fields": "username,name",
-    }
-    resp = requests.get(
+    params = TWEET_PARAMS
+    resp = _request(
+        "GET",
         f"{API_BASE}/tweets/search/stream",
         params=params,
         headers=_bearer_headers(),
         stream=True,
     )
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        if resp.status_code == 403:
-            print("Hint: Filtered stream requires Pro access ($5,000/month).", file=sys.stderr)
-        sys.exit(1)
+    _check(resp, pro_feature="Filtered stream")
 
-    count = 0
-    try:
-        for line in resp.iter_lines():
-            if not line:
-                continue  # Skip keep-alive newlines
-            try:
-                tweet_data = json.loads(line)
-                print(json.dumps(tweet_data, indent=2, default=str))
-                count += 1
-                if count >= n:
-                    break
-            except json.JSONDecodeError:
-                continue
-    except KeyboardInterrupt:
-        pass
-    finally:
-        resp.close()
+    _print_stream(resp, n)
 
 
 # ── Commands: Volume Stream (Bearer Token, Pro access) ──
@@ -1451,43 +1913,18 @@ def cmd_stream_filter(args):
 
 def cmd_stream_sample(args):
     """Connect to 1% volume stream and collect tweets (Pro access required)."""
-    import requests
-
     n = args.n
-    params = {
-        "tweet.fields": "created_at,author_id,text,public_metrics",
-        "expansions": "author_id",
-        "user.fields": "username,name",
-    }
-    resp = requests.get(
+    params = TWEET_PARAMS
+    resp = _request(
+        "GET",
         f"{API_BASE}/tweets/sample/stream",
         params=params,
         headers=_bearer_headers(),
         stream=True,
     )
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        if resp.status_code == 403:
-            print("Hint: Volume stream requires Pro access ($5,000/month).", file=sys.stderr)
-        sys.exit(1)
+    _check(resp, pro_feature="Volume stream")
 
-    count = 0
-    try:
-        for line in resp.iter_lines():
-            if not line:
-                continue  # Skip keep-alive newlines
-            try:
-                tweet_data = json.loads(line)
-                print(json.dumps(tweet_data, indent=2, default=str))
-                count += 1
-                if count >= n:
-                    break
-            except json.JSONDecodeError:
-                continue
-    except KeyboardInterrupt:
-        pass
-    finally:
-        resp.close()
+    _print_stream(resp, n)
 
 
 # ── Commands: Full-Archive Search (Bearer Token, Pro access) ──
@@ -1495,30 +1932,17 @@ def cmd_stream_sample(args):
 
 def cmd_search_all(args):
     """Search the full archive of tweets (Pro access required)."""
-    import requests
-
     n = max(args.n, 10)
-    params = {
-        "query": args.query,
-        "max_results": min(n, 500),
-        "tweet.fields": "created_at,author_id,conversation_id,text,public_metrics",
-        "expansions": "author_id",
-        "user.fields": "username,name",
-    }
-    resp = requests.get(
+    params = {"query": args.query, "max_results": min(n, 500), **CONVERSATION_TWEET_PARAMS}
+    resp = _request(
+        "GET",
         f"{API_BASE}/tweets/search/all",
         params=params,
         headers=_bearer_headers(),
     )
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        if resp.status_code == 403:
-            print("Hint: Full-archive search requires Pro access ($5,000/month).", file=sys.stderr)
-        sys.exit(1)
-    data = resp.json()
+    data = _checked_json(resp, pro_feature="Full-archive search")
     _merge_authors(data)
-    for tweet in (data.get("data") or []):
-        print(json.dumps(tweet, indent=2, default=str))
+    _print_items(data.get("data") or [])
     if not data.get("data"):
         print("No results found.", file=sys.stderr)
 
@@ -1528,126 +1952,88 @@ def cmd_search_all(args):
 
 def cmd_my_lists(args):
     """List your owned lists."""
-    import requests
     auth = get_oauth1()
     user_id = _get_my_user_id()
-    params = {"list.fields": "description,member_count,follower_count,created_at,private"}
-    resp = requests.get(f"{API_BASE}/users/{user_id}/owned_lists", params=params, auth=auth)
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    data = resp.json()
-    for lst in (data.get("data") or []):
-        print(json.dumps(lst, indent=2, default=str))
+    params = MY_LISTS_PARAMS
+    resp = _request("GET", f"{API_BASE}/users/{user_id}/owned_lists", params=params, auth=auth)
+    data = _checked_json(resp)
+    _print_items(data.get("data") or [])
     if not data.get("data"):
         print("No lists found.", file=sys.stderr)
 
 
 def cmd_list_get(args):
     """Look up a list by ID."""
-    import requests
     auth = get_oauth1()
-    params = {"list.fields": "description,member_count,follower_count,created_at,private,owner_id"}
-    resp = requests.get(f"{API_BASE}/lists/{args.list_id}", params=params, auth=auth)
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    data = resp.json().get("data", resp.json())
-    print(json.dumps(data, indent=2, default=str))
+    params = LIST_DETAIL_PARAMS
+    resp = _request("GET", f"{API_BASE}/lists/{args.list_id}", params=params, auth=auth)
+    result = _checked_json(resp)
+    data = result.get("data", result)
+    _emit(data)
 
 
 def cmd_list_create(args):
     """Create a new list."""
-    import requests
     auth = get_oauth1()
     payload = {"name": args.name}
     if args.description:
         payload["description"] = args.description
     if args.private:
         payload["private"] = True
-    resp = requests.post(f"{API_BASE}/lists", json=payload, auth=auth)
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    print(json.dumps(resp.json(), indent=2, default=str))
+    resp = _request("POST", f"{API_BASE}/lists", json=payload, auth=auth)
+    _emit(_checked_json(resp))
 
 
 def cmd_list_delete(args):
     """Delete a list you own."""
-    import requests
     auth = get_oauth1()
-    resp = requests.delete(f"{API_BASE}/lists/{args.list_id}", auth=auth)
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    print(json.dumps(resp.json(), indent=2, default=str))
+    resp = _request("DELETE", f"{API_BASE}/lists/{args.list_id}", auth=auth)
+    _emit(_checked_json(resp))
 
 
 def cmd_list_tweets(args):
     """Fetch tweets from a list."""
-    import requests
     auth = get_oauth1()
     n = min(max(args.n, 1), 100)
-    params = {
-        "max_results": n,
-        "tweet.fields": "created_at,author_id,text,public_metrics",
-        "expansions": "author_id",
-        "user.fields": "username,name",
-    }
-    resp = requests.get(f"{API_BASE}/lists/{args.list_id}/tweets", params=params, auth=auth)
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    data = resp.json()
+    params = {"max_results": n, **TWEET_PARAMS}
+    resp = _request("GET", f"{API_BASE}/lists/{args.list_id}/tweets", params=params, auth=auth)
+    data = _checked_json(resp)
     _merge_authors(data)
-    for tweet in (data.get("data") or []):
-        print(json.dumps(tweet, indent=2, default=str))
+    _print_items(data.get("data") or [])
     if not data.get("data"):
         print("No tweets found in this list.", file=sys.stderr)
 
 
 def cmd_list_members(args):
     """List members of a list."""
-    import requests
     auth = get_oauth1()
-    params = {"user.fields": "username,name,public_metrics,verified"}
-    resp = requests.get(f"{API_BASE}/lists/{args.list_id}/members", params=params, auth=auth)
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    data = resp.json()
-    for user in (data.get("data") or []):
-        print(json.dumps(user, indent=2, default=str))
+    params = {"user.fields": ENGAGER_USER_FIELDS}
+    resp = _request("GET", f"{API_BASE}/lists/{args.list_id}/members", params=params, auth=auth)
+    data = _checked_json(resp)
+    _print_items(data.get("data") or [])
     if not data.get("data"):
         print("No members found in this list.", file=sys.stderr)
 
 
 def cmd_list_add_member(args):
     """Add a user to a list."""
-    import requests
     auth = get_oauth1()
     target_id = _resolve_username(args.username)
-    resp = requests.post(
+    resp = _request(
+        "POST",
         f"{API_BASE}/lists/{args.list_id}/members",
         json={"user_id": target_id},
         auth=auth,
     )
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    print(json.dumps(resp.json(), indent=2, default=str))
+    _emit(_checked_json(resp))
 
 
 def cmd_list_remove_member(args):
     """Remove a user from a list."""
-    import requests
     auth = get_oauth1()
     target_id = _resolve_username(args.username)
-    resp = requests.delete(f"{API_BASE}/lists/{args.list_id}/members/{target_id}", auth=auth)
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    print(json.dumps(resp.json(), indent=2, default=str))
+    resp = _request("DELETE", f"{API_BASE}/lists/{args.list_id}/members/{target_id}", auth=auth)
+    _emit(_checked_json(resp))
 
 
 # ── Commands: Trends (Bearer Token) ──
@@ -1655,15 +2041,10 @@ def cmd_list_remove_member(args):
 
 def cmd_trends(args):
     """Get personalized or location-based trends."""
-    import requests
     headers = _bearer_headers()
-    resp = requests.get(f"{API_BASE}/trends/by/woeid/{args.woeid}", headers=headers)
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    data = resp.json()
-    for trend in (data.get("data") or []):
-        print(json.dumps(trend, indent=2, default=str))
+    resp = _request("GET", f"{API_BASE}/trends/by/woeid/{args.woeid}", headers=headers)
+    data = _checked_json(resp)
+    _print_items(data.get("data") or [])
     if not data.get("data"):
         print("No trends found.", file=sys.stderr)
 
@@ -1673,326 +2054,384 @@ def cmd_trends(args):
 
 def cmd_spaces_search(args):
     """Search for Spaces."""
-    import requests
     headers = _bearer_headers()
-    params = {
-        "query": args.query,
-        "space.fields": "title,host_ids,created_at,participant_count,state,lang",
-    }
-    resp = requests.get(f"{API_BASE}/spaces/search", params=params, headers=headers)
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
-        sys.exit(1)
-    data = resp.json()
-    for space in (data.get("data") or []):
-        print(json.dumps(space, indent=2, default=str))
+    params = {"query": args.query, "space.fields": SPACE_FIELDS}
+    resp = _request("GET", f"{API_BASE}/spaces/search", params=params, headers=headers)
+    data = _checked_json(resp)
+    _print_items(data.get("data") or [])
     if not data.get("data"):
         print("No spaces found.", file=sys.stderr)
 
 
 def cmd_space_get(args):
     """Look up a Space by ID."""
-    import requests
     headers = _bearer_headers()
-    params = {
-        "space.fields": "title,host_ids,created_at,participant_count,state,lang,scheduled_start",
-    }
-    resp = requests.get(f"{API_BASE}/spaces/{args.space_id}", params=params, headers=headers)
-    if not resp.ok:
-        print(f"Error: {resp.status_code} {resp.text}", file=sys.stderr)
+    params = SPACE_DETAIL_PARAMS
+    resp = _request("GET", f"{API_BASE}/spaces/{args.space_id}", params=params, headers=headers)
+    result = _checked_json(resp)
+    data = result.get("data", result)
+    _emit(data)
+
+
+# ── Commands: Bulk ──
+
+# Commands that make no sense inside `bulk`: interactive, long-running, or recursive
+BULK_EXCLUDED = {"auth", "bulk", "stream-filter", "stream-sample"}
+
+
+def cmd_bulk(args):
+    """Run one command per stdin line (e.g. "follow @nasa", "like 1234") concurrently.
+
+    Every line is validated before anything runs. Each command's output is
+    printed as one block when it finishes; the process exits non-zero if any failed.
+    """
+    import shlex
+
+    parser = _build_parser()
+    jobs = []
+    for lineno, line in enumerate(sys.stdin, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            argv = shlex.split(line)
+        except ValueError as e:
+            print(f"Error: line {lineno}: {e}", file=sys.stderr)
+            sys.exit(1)
+        if argv[0].startswith("-"):
+            # --compact/--pretty set process-wide state; they apply to the whole run, not one line
+            print(f"Error: line {lineno}: global options go before 'bulk', not on a line: {line}", file=sys.stderr)
+            sys.exit(1)
+        try:
+            cmd_args = parser.parse_args(argv)
+        except SystemExit:
+            print(f"Error: line {lineno}: invalid command: {line}", file=sys.stderr)
+            sys.exit(1)
+        if cmd_args.command in BULK_EXCLUDED:
+            print(f"Error: line {lineno}: '{cmd_args.command}' cannot be used in bulk", file=sys.stderr)
+            sys.exit(1)
+        jobs.append((lineno, cmd_args))
+
+    def run_one(job):
+        _, cmd_args = job
+        with stdout.capture() as out, stderr.capture() as err:
+            try:
+                cmd_args.func(cmd_args)
+                ok = True
+            except SystemExit as e:
+                ok = not e.code
+        return ok, out.getvalue(), err.getvalue()
+
+    real_stdout, real_stderr = sys.stdout, sys.stderr
+    sys.stdout = stdout = _CapturedStream(real_stdout, _BULK_STDOUT)
+    sys.stderr = stderr = _CapturedStream(real_stderr, _BULK_STDERR)
+    failed = 0
+    try:
+        for (lineno, _), result, error in _ConcurrentRunner(max_workers=args.max_concurrency).run(run_one, jobs):
+            if error is not None:
+                ok, out, err = False, "", f"Error: {error}\n"
+            else:
+                ok, out, err = result
+            real_stdout.write(out)
+            if err:
+                real_stderr.write("".join(f"[line {lineno}] {line}\n" for line in err.splitlines()))
+            failed += not ok
+    finally:
+        sys.stdout, sys.stderr = real_stdout, real_stderr
+
+    print(f"bulk: {len(jobs) - failed}/{len(jobs)} succeeded", file=sys.stderr)
+    if failed:
         sys.exit(1)
-    data = resp.json().get("data", resp.json())
-    print(json.dumps(data, indent=2, default=str))
 
 
 # ── CLI Entry Point ──
 
 
-def main():
+class _SkippedParser:
+    """Stand-in for a subcommand parser that isn't needed for this invocation."""
+
+    def add_argument(self, *args, **kwargs):
+        pass
+
+
+def _positive_int(value):
+    """argparse type for counts that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def _max_concurrency(value):
+    """argparse type for bulk --max-concurrency: 1..MAX_CONCURRENCY, the size of the connection pool."""
+    number = _positive_int(value)
+    if number > MAX_CONCURRENCY:
+        raise argparse.ArgumentTypeError(f"must be at most {MAX_CONCURRENCY} (the connection pool size), got {number}")
+    return number
+
+
+def _build_parser(command=None):
+    """Build the CLI parser. Given `command`, only that subcommand's parser is constructed."""
     parser = argparse.ArgumentParser(description="X/Twitter CLI (v2 API + OAuth1/Bearer/PKCE)")
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument("--compact", action="store_true", help="Print one JSON document per line")
+    output.add_argument("--pretty", dest="compact", action="store_false", help="Print indented JSON (default)")
     sub = parser.add_subparsers(dest="command", required=True)
 
+    def add_parser(name, func, **kwargs):
+        if command is None or name == command:
+            p = sub.add_parser(name, **kwargs)
+            p.set_defaults(func=func)
+            return p
+        return _SkippedParser()
+
     # Post & Reply
-    p_tweet = sub.add_parser("tweet", help="Post a tweet")
+    p_tweet = add_parser("tweet", cmd_tweet, help="Post a tweet")
     p_tweet.add_argument("text", help="Tweet text (max 280 chars)")
 
-    p_reply = sub.add_parser("reply", help="Reply to a tweet")
+    p_reply = add_parser("reply", cmd_reply, help="Reply to a tweet")
     p_reply.add_argument("tweet_id", help="Tweet ID to reply to")
     p_reply.add_argument("text", help="Reply text (max 280 chars)")
 
-    p_delete = sub.add_parser("delete", help="Delete a tweet")
+    p_delete = add_parser("delete", cmd_delete, help="Delete a tweet")
     p_delete.add_argument("tweet_id", help="Tweet ID to delete")
 
     # Read
-    p_get = sub.add_parser("get", help="Fetch a tweet by ID")
-    p_get.add_argument("tweet_id", help="Tweet ID")
+    p_get = add_parser("get", cmd_get, help="Fetch tweets by ID")
+    p_get.add_argument("tweet_ids", nargs="+", metavar="tweet_id", help="Tweet ID(s)")
 
-    p_thread = sub.add_parser("thread", help="Fetch conversation thread")
+    p_thread = add_parser("thread", cmd_thread, help="Fetch conversation thread")
     p_thread.add_argument("tweet_id", help="Any tweet ID in the thread")
     p_thread.add_argument("-n", type=int, default=20, help="Max results")
+    p_thread.add_argument("--convo-id", help="Conversation ID, if known (skips the tweet lookup)")
 
-    p_thread_chain = sub.add_parser("thread-chain", help="Walk an author's full thread")
+    p_thread_chain = add_parser("thread-chain", cmd_thread_chain, help="Walk an author's full thread")
     p_thread_chain.add_argument("tweet_id", help="Any tweet ID in the thread")
     p_thread_chain.add_argument("-n", type=int, default=20, help="Max results")
 
-    p_quotes = sub.add_parser("quotes", help="Get quote tweets of a tweet")
+    p_quotes = add_parser("quotes", cmd_quotes, help="Get quote tweets of a tweet")
     p_quotes.add_argument("tweet_id", help="Tweet ID")
     p_quotes.add_argument("-n", type=int, default=10, help="Max results")
 
-    p_search = sub.add_parser("search", help="Search recent tweets")
+    p_search = add_parser("search", cmd_search, help="Search recent tweets")
     p_search.add_argument("query", help="Search query")
     p_search.add_argument("-n", type=int, default=10, help="Max results")
 
-    p_mentions = sub.add_parser("mentions", help="Get your mentions")
+    p_search_many = add_parser("search-many", cmd_search_many, help="Run many searches from a file, OR-batched")
+    p_search_many.add_argument("--file", required=True, help="File with one query per line ('-' for stdin)")
+    p_search_many.add_argument("-n", type=int, default=10, help="Max results per batched request")
+    p_search_many.add_argument("--all", action="store_true", help="Search the full archive (Pro)")
+
+    p_mentions = add_parser("mentions", cmd_mentions, help="Get your mentions")
     p_mentions.add_argument("-n", type=int, default=10, help="Max results")
 
-    p_timeline = sub.add_parser("timeline", help="Get your timeline")
+    p_timeline = add_parser("timeline", cmd_timeline, help="Get your timeline")
     p_timeline.add_argument("-n", type=int, default=10, help="Max results")
 
     # Research
-    p_user = sub.add_parser("user", help="Look up a user's profile")
+    p_user = add_parser("user", cmd_user, help="Look up a user's profile")
     p_user.add_argument("username", help="Username to look up (with or without @)")
 
-    p_user_tl = sub.add_parser("user-timeline", help="Get a user's recent tweets")
+    p_users = add_parser("users", cmd_users, help="Look up several users' profiles at once")
+    p_users.add_argument("usernames", nargs="+", metavar="username", help="Usernames (with or without @)")
+
+    p_user_tl = add_parser("user-timeline", cmd_user_timeline, help="Get a user's recent tweets")
     p_user_tl.add_argument("username", help="Username (with or without @)")
     p_user_tl.add_argument("-n", type=int, default=10, help="Max results")
     p_user_tl.add_argument("--include-rts", action="store_true", help="Include retweets")
 
-    p_followers = sub.add_parser("followers", help="List a user's followers")
+    p_followers = add_parser("followers", cmd_followers, help="List a user's followers")
     p_followers.add_argument("username", help="Username (with or without @)")
     p_followers.add_argument("-n", type=int, default=100, help="Max results (up to 1000)")
 
-    p_following = sub.add_parser("following", help="List who a user follows")
+    p_following = add_parser("following", cmd_following, help="List who a user follows")
     p_following.add_argument("username", help="Username (with or without @)")
     p_following.add_argument("-n", type=int, default=100, help="Max results (up to 1000)")
 
-    p_liked = sub.add_parser("liked", help="List tweets liked by a user")
+    p_liked = add_parser("liked", cmd_liked, help="List tweets liked by a user")
     p_liked.add_argument("username", help="Username (with or without @)")
     p_liked.add_argument("-n", type=int, default=20, help="Max results")
 
-    p_liking = sub.add_parser("liking-users", help="List users who liked a tweet")
+    p_liking = add_parser("liking-users", cmd_liking_users, help="List users who liked a tweet")
     p_liking.add_argument("tweet_id", help="Tweet ID")
 
-    p_retweeters = sub.add_parser("retweeters", help="List users who retweeted a tweet")
+    p_retweeters = add_parser("retweeters", cmd_retweeters, help="List users who retweeted a tweet")
     p_retweeters.add_argument("tweet_id", help="Tweet ID")
 
     # Engage
-    p_like = sub.add_parser("like", help="Like a tweet")
+    p_like = add_parser("like", cmd_like, help="Like a tweet")
     p_like.add_argument("tweet_id", help="Tweet ID to like")
 
-    p_unlike = sub.add_parser("unlike", help="Unlike a tweet")
+    p_unlike = add_parser("unlike", cmd_unlike, help="Unlike a tweet")
     p_unlike.add_argument("tweet_id", help="Tweet ID to unlike")
 
-    p_follow = sub.add_parser("follow", help="Follow a user")
+    p_follow = add_parser("follow", cmd_follow, help="Follow a user")
     p_follow.add_argument("username", help="Username to follow (with or without @)")
 
-    p_unfollow = sub.add_parser("unfollow", help="Unfollow a user")
+    p_unfollow = add_parser("unfollow", cmd_unfollow, help="Unfollow a user")
     p_unfollow.add_argument("username", help="Username to unfollow (with or without @)")
 
-    p_retweet = sub.add_parser("retweet", help="Retweet a tweet")
+    p_retweet = add_parser("retweet", cmd_retweet, help="Retweet a tweet")
     p_retweet.add_argument("tweet_id", help="Tweet ID to retweet")
 
-    p_unretweet = sub.add_parser("unretweet", help="Undo a retweet")
+    p_unretweet = add_parser("unretweet", cmd_unretweet, help="Undo a retweet")
     p_unretweet.add_argument("tweet_id", help="Tweet ID to unretweet")
 
     # Hide replies
-    p_hide = sub.add_parser("hide", help="Hide a reply to your tweet")
+    p_hide = add_parser("hide", cmd_hide, help="Hide a reply to your tweet")
     p_hide.add_argument("tweet_id", help="Tweet ID to hide")
 
-    p_unhide = sub.add_parser("unhide", help="Unhide a reply to your tweet")
+    p_unhide = add_parser("unhide", cmd_unhide, help="Unhide a reply to your tweet")
     p_unhide.add_argument("tweet_id", help="Tweet ID to unhide")
 
     # Moderate
-    p_mute = sub.add_parser("mute", help="Mute a user")
+    p_mute = add_parser("mute", cmd_mute, help="Mute a user")
     p_mute.add_argument("username", help="Username to mute (with or without @)")
 
-    p_unmute = sub.add_parser("unmute", help="Unmute a user")
+    p_unmute = add_parser("unmute", cmd_unmute, help="Unmute a user")
     p_unmute.add_argument("username", help="Username to unmute (with or without @)")
 
-    p_block = sub.add_parser("block", help="Block a user")
+    p_block = add_parser("block", cmd_block, help="Block a user")
     p_block.add_argument("username", help="Username to block (with or without @)")
 
-    p_unblock = sub.add_parser("unblock", help="Unblock a user")
+    p_unblock = add_parser("unblock", cmd_unblock, help="Unblock a user")
     p_unblock.add_argument("username", help="Username to unblock (with or without @)")
 
     # Direct Messages
-    p_dm = sub.add_parser("dm", help="Send a DM to a user")
+    p_dm = add_parser("dm", cmd_dm, help="Send a DM to a user")
     p_dm.add_argument("username", help="Username to message (with or without @)")
     p_dm.add_argument("text", help="Message text")
 
-    p_dm_list = sub.add_parser("dm-list", help="List recent DM events")
+    p_dm_list = add_parser("dm-list", cmd_dm_list, help="List recent DM events")
     p_dm_list.add_argument("-n", type=int, default=20, help="Max results")
 
-    p_dm_convo = sub.add_parser("dm-conversation", help="List DMs in a conversation")
+    p_dm_convo = add_parser("dm-conversation", cmd_dm_conversation, help="List DMs in a conversation")
     p_dm_convo.add_argument("conversation_id", help="DM conversation ID")
     p_dm_convo.add_argument("-n", type=int, default=20, help="Max results")
 
     # Account
-    sub.add_parser("verify", help="Verify authentication")
-    sub.add_parser("me", help="Get your profile info")
+    add_parser("verify", cmd_verify, help="Verify authentication")
+    add_parser("me", cmd_me, help="Get your profile info")
 
-    p_profile = sub.add_parser("profile", help="Update your bio")
+    p_profile = add_parser("profile", cmd_profile, help="Update your bio")
     p_profile.add_argument("text", help="New bio text")
 
     # OAuth 2.0 PKCE
-    sub.add_parser("auth", help="Authorize OAuth 2.0 PKCE (required for bookmarks)")
+    add_parser("auth", cmd_auth, help="Authorize OAuth 2.0 PKCE (required for bookmarks)")
 
     # Bookmarks (requires OAuth 2.0 PKCE — run 'auth' first)
-    p_bookmarks = sub.add_parser("bookmarks", help="List your bookmarks (requires 'auth')")
+    p_bookmarks = add_parser("bookmarks", cmd_bookmarks, help="List your bookmarks (requires 'auth')")
     p_bookmarks.add_argument("-n", type=int, default=20, help="Max results")
 
-    p_bookmark = sub.add_parser("bookmark", help="Bookmark a tweet (requires 'auth')")
+    p_bookmark = add_parser("bookmark", cmd_bookmark, help="Bookmark a tweet (requires 'auth')")
     p_bookmark.add_argument("tweet_id", help="Tweet ID to bookmark")
 
-    p_unbookmark = sub.add_parser("unbookmark", help="Remove a bookmark (requires 'auth')")
+    p_unbookmark = add_parser("unbookmark", cmd_unbookmark, help="Remove a bookmark (requires 'auth')")
     p_unbookmark.add_argument("tweet_id", help="Tweet ID to unbookmark")
 
-    p_bfold = sub.add_parser("bookmark-folders", help="List bookmark folders (requires 'auth')")
+    p_bfold = add_parser("bookmark-folders", cmd_bookmark_folders, help="List bookmark folders (requires 'auth')")
 
-    p_bfoldt = sub.add_parser("bookmarks-folder", help="Bookmarks in a folder (requires 'auth')")
+    p_bfoldt = add_parser("bookmarks-folder", cmd_bookmarks_folder, help="Bookmarks in a folder (requires 'auth')")
     p_bfoldt.add_argument("folder_id", help="Folder ID")
     p_bfoldt.add_argument("-n", type=int, default=20, help="Max results")
 
     # Filtered Stream (Pro access)
-    p_sr_add = sub.add_parser("stream-rules-add", help="Add a filtered stream rule (Pro)")
+    p_sr_add = add_parser("stream-rules-add", cmd_stream_rules_add, help="Add a filtered stream rule (Pro)")
     p_sr_add.add_argument("rule", help="Stream rule (e.g. 'keyword1 OR keyword2')")
     p_sr_add.add_argument("--tag", default=None, help="Optional label for the rule")
 
-    sub.add_parser("stream-rules-list", help="List filtered stream rules (Pro)")
+    add_parser("stream-rules-list", cmd_stream_rules_list, help="List filtered stream rules (Pro)")
 
-    p_sr_del = sub.add_parser("stream-rules-delete", help="Delete a stream rule (Pro)")
+    p_sr_del = add_parser("stream-rules-delete", cmd_stream_rules_delete, help="Delete a stream rule (Pro)")
     p_sr_del.add_argument("rule_id", help="Rule ID to delete")
 
-    p_sf = sub.add_parser("stream-filter", help="Connect to filtered stream (Pro)")
+    p_sf = add_parser("stream-filter", cmd_stream_filter, help="Connect to filtered stream (Pro)")
     p_sf.add_argument("-n", type=int, default=10, help="Number of tweets to collect")
 
     # Volume Stream (Pro access)
-    p_ss = sub.add_parser("stream-sample", help="Connect to 1%% volume stream (Pro)")
+    p_ss = add_parser("stream-sample", cmd_stream_sample, help="Connect to 1%% volume stream (Pro)")
     p_ss.add_argument("-n", type=int, default=10, help="Number of tweets to collect")
 
     # Full-Archive Search (Pro access)
-    p_sa = sub.add_parser("search-all", help="Full-archive search (Pro)")
+    p_sa = add_parser("search-all", cmd_search_all, help="Full-archive search (Pro)")
     p_sa.add_argument("query", help="Search query")
     p_sa.add_argument("-n", type=int, default=10, help="Max results")
 
     # Lists
-    sub.add_parser("my-lists", help="List your owned lists")
+    add_parser("my-lists", cmd_my_lists, help="List your owned lists")
 
-    p_list = sub.add_parser("list", help="Look up a list by ID")
+    p_list = add_parser("list", cmd_list_get, help="Look up a list by ID")
     p_list.add_argument("list_id", help="List ID")
 
-    p_lc = sub.add_parser("list-create", help="Create a new list")
+    p_lc = add_parser("list-create", cmd_list_create, help="Create a new list")
     p_lc.add_argument("name", help="List name")
     p_lc.add_argument("--description", default=None, help="List description")
     p_lc.add_argument("--private", action="store_true", help="Make the list private")
 
-    p_ld = sub.add_parser("list-delete", help="Delete a list")
+    p_ld = add_parser("list-delete", cmd_list_delete, help="Delete a list")
     p_ld.add_argument("list_id", help="List ID to delete")
 
-    p_lt = sub.add_parser("list-tweets", help="Get tweets from a list")
+    p_lt = add_parser("list-tweets", cmd_list_tweets, help="Get tweets from a list")
     p_lt.add_argument("list_id", help="List ID")
     p_lt.add_argument("-n", type=int, default=20, help="Max results")
 
-    p_lm = sub.add_parser("list-members", help="List members of a list")
+    p_lm = add_parser("list-members", cmd_list_members, help="List members of a list")
     p_lm.add_argument("list_id", help="List ID")
 
-    p_la = sub.add_parser("list-add-member", help="Add a user to a list")
+    p_la = add_parser("list-add-member", cmd_list_add_member, help="Add a user to a list")
     p_la.add_argument("list_id", help="List ID")
     p_la.add_argument("username", help="Username to add (with or without @)")
 
-    p_lr = sub.add_parser("list-remove-member", help="Remove a user from a list")
+    p_lr = add_parser("list-remove-member", cmd_list_remove_member, help="Remove a user from a list")
     p_lr.add_argument("list_id", help="List ID")
     p_lr.add_argument("username", help="Username to remove (with or without @)")
 
     # Trends
-    p_trends = sub.add_parser("trends", help="Get trends for a location (WOEID)")
+    p_trends = add_parser("trends", cmd_trends, help="Get trends for a location (WOEID)")
     p_trends.add_argument("--woeid", type=int, default=1, help="WOEID (default: 1 = worldwide)")
 
     # Spaces
-    p_spaces = sub.add_parser("spaces", help="Search for Spaces")
+    p_spaces = add_parser("spaces", cmd_spaces_search, help="Search for Spaces")
     p_spaces.add_argument("query", help="Search query")
 
-    p_space = sub.add_parser("space", help="Look up a Space by ID")
+    p_space = add_parser("space", cmd_space_get, help="Look up a Space by ID")
     p_space.add_argument("space_id", help="Space ID")
 
-    args = parser.parse_args()
-
-    commands = {
-        # Post & Reply
-        "tweet": cmd_tweet,
-        "reply": cmd_reply,
-        "delete": cmd_delete,
-        # Read
-        "get": cmd_get,
-        "thread": cmd_thread,
-        "thread-chain": cmd_thread_chain,
-        "quotes": cmd_quotes,
-        "search": cmd_search,
-        "mentions": cmd_mentions,
-        "timeline": cmd_timeline,
-        # Research
-        "user": cmd_user,
-        "user-timeline": cmd_user_timeline,
-        "followers": cmd_followers,
-        "following": cmd_following,
-        "liked": cmd_liked,
-        "liking-users": cmd_liking_users,
-        "retweeters": cmd_retweeters,
-        # Engage
-        "like": cmd_like,
-        "unlike": cmd_unlike,
-        "follow": cmd_follow,
-        "unfollow": cmd_unfollow,
-        "retweet": cmd_retweet,
-        "unretweet": cmd_unretweet,
-        "hide": cmd_hide,
-        "unhide": cmd_unhide,
-        # Moderate
-        "mute": cmd_mute,
-        "unmute": cmd_unmute,
-        "block": cmd_block,
-        "unblock": cmd_unblock,
-        # Direct Messages
-        "dm": cmd_dm,
-        "dm-list": cmd_dm_list,
-        "dm-conversation": cmd_dm_conversation,
-        # Account
-        "verify": cmd_verify,
-        "me": cmd_me,
-        "profile": cmd_profile,
-        # Auth
-        "auth": cmd_auth,
-        # Bookmarks
-        "bookmarks": cmd_bookmarks,
-        "bookmark": cmd_bookmark,
-        "unbookmark": cmd_unbookmark,
-        "bookmark-folders": cmd_bookmark_folders,
-        "bookmarks-folder": cmd_bookmarks_folder,
-        # Lists
-        "my-lists": cmd_my_lists,
-        "list": cmd_list_get,
-        "list-create": cmd_list_create,
-        "list-delete": cmd_list_delete,
-        "list-tweets": cmd_list_tweets,
-        "list-members": cmd_list_members,
-        "list-add-member": cmd_list_add_member,
-        "list-remove-member": cmd_list_remove_member,
-        # Trends
-        "trends": cmd_trends,
-        # Spaces
-        "spaces": cmd_spaces_search,
-        "space": cmd_space_get,
-        # Streams (Pro)
-        "stream-rules-add": cmd_stream_rules_add,
-        "stream-rules-list": cmd_stream_rules_list,
-        "stream-rules-delete": cmd_stream_rules_delete,
-        "stream-filter": cmd_stream_filter,
-        "stream-sample": cmd_stream_sample,
-        # Full-archive search (Pro)
-        "search-all": cmd_search_all,
-    }
+    # Bulk
+    p_bulk = add_parser("bulk", cmd_bulk, help="Run commands read from stdin (one per line) concurrently")
+    p_bulk.add_argument(
+        "--max-concurrency",
+        type=_max_concurrency,
+        default=MAX_CONCURRENCY,
+        help=f"Upper bound on parallel requests (1-{MAX_CONCURRENCY})",
+    )
 
-    commands[args.command](args)
+    if command is not None and command not in sub.choices:
+        return _build_parser()  # unknown command: build everything so argparse can list the choices
+    return parser
+
+
+def _requested_command(argv):
+    """Return the subcommand named in argv, or None when the full parser is needed (help)."""
+    for arg in argv:
+        if arg in ("-h", "--help"):
+            return None
+        if not arg.startswith("-"):
+            return arg
+    return None
+
+
+def main(argv=None):
+    """Run one CLI command. argv defaults to sys.argv[1:]; pass a list to call in-process."""
+    global COMPACT_OUTPUT
+    if argv is None:
+        argv = sys.argv[1:]
+    args = _build_parser(_requested_command(argv)).parse_args(argv)
+    COMPACT_OUTPUT = args.compact
+    args.func(args)
 
 
 if __name__ == "__main__":
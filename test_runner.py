@@ -10,11 +10,15 @@ Usage:
     python3 test_runner.py
 """
 
+import contextlib
+import functools
+import io
 import json
 import os
 import subprocess
 import sys
 import time
+import traceback
 import uuid
 from pathlib import Path
 
@@ -23,10 +27,15 @@ from pathlib import Path
 ROOT_DIR = Path(__file__).resolve().parent
 SCRIPT = ROOT_DIR / "scripts" / "x-api-skill.py"
 
-# Load .env
 try:
-    from dotenv import load_dotenv
-    load_dotenv(ROOT_DIR / ".env", override=True)
+    import orjson
+except ImportError:
+    orjson = None
+
+# Importing readline gives input() line editing and history between prompts
+try:
+    import readline
+    readline.set_history_length(200)
 except ImportError:
     pass
 
@@ -41,66 +50,206 @@ CYAN = "\033[36m"
 WHITE = "\033[37m"
 RESET = "\033[0m"
 
+# Pre-built templates for the per-result and per-prompt output
+OK_LABEL = f"\n  {GREEN}OK{RESET} {BOLD}{{}}{RESET}"
+ERROR_LABEL = f"\n  {RED}ERROR{RESET} {BOLD}{{}}{RESET}"
+DIM_LINE = f"    {DIM}{{}}{RESET}"
+WARN_LINE = f"    {YELLOW}{{}}{RESET}"
+ASK_PROMPT = f"  {BOLD}{{}}{RESET}{DIM}{{}}{RESET}: "
+CONFIRM_PROMPT = f"  {YELLOW}{{}}. Proceed? (y/n){RESET} [{BOLD}y{RESET}]: "
+HEADER = (
+    f"\n{BOLD}{CYAN}  x-api-skill — Interactive API Explorer{RESET}\n"
+    f"  {DIM}Run commands against the live X API and see results{RESET}\n"
+    f"  {CYAN}{'─' * 52}{RESET}\n"
+)
+
 
 # ── Runner ──
 
-def xapi(*args, timeout=30):
-    """Run an x-api-skill command, return (ok, stdout, stderr)."""
+
+@functools.cache
+def _bootstrap():
+    """Load .env on first use rather than at import, so quitting straight away stays cheap."""
+    try:
+        from dotenv import load_dotenv
+        load_dotenv(ROOT_DIR / ".env", override=True)
+    except ImportError:
+        pass
+
+
+# Streams write straight to the stdout file descriptor and only stop when
+# killed, so they always get their own process
+SUBPROCESS_COMMANDS = {"stream-filter", "stream-sample"}
+
+
+def _load_skill():
+    """Import the x-api-skill script once (its hyphenated name rules out a plain import)."""
+    if not hasattr(_load_skill, "_cached"):
+        import importlib.util
+        spec = importlib.util.spec_from_file_location("x_api_skill", SCRIPT)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _load_skill._cached = module
+    return _load_skill._cached
+
+
+class _StderrCapture(io.StringIO):
+    """Captures a command's stderr, echoing rate-limit waits live so a long sleep doesn't look like a hang."""
+
+    def __init__(self, console):
+        super().__init__()
+        self._console = console
+
+    def write(self, s):
+        if s.startswith("Rate limit"):
+            self._console.write(DIM_LINE.format(s.rstrip()) + "\n")
+            self._console.flush()
+        return super().write(s)
+
+
+def xapi(*args, timeout=30, stdin=""):
+    """Run an x-api-skill command, return (ok, stdout, stderr). stdin is fed to the command (for bulk).
+
+    Commands run in-process, which skips interpreter startup and reuses the
+    skill's HTTP session and caches between calls. There `timeout` bounds each
+    HTTP request, and an unexpected exception is returned as a failure with its
+    traceback. Streams, and every command when XAPI_SUBPROCESS=1 is set, run in
+    a subprocess that is killed after `timeout` seconds.
+    """
+    _bootstrap()
+    if args[0] in SUBPROCESS_COMMANDS or os.environ.get("XAPI_SUBPROCESS"):
+        return _xapi_subprocess(*args, timeout=timeout, stdin=stdin)
+    skill = _load_skill()
+    skill.REQUEST_TIMEOUT = timeout
+    out, err = io.StringIO(), _StderrCapture(sys.stdout)
+    code = 0
+    real_stdin, sys.stdin = sys.stdin, io.StringIO(stdin)
+    try:
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            skill.main(list(args))
+    except SystemExit as e:
+        code = e.code
+    except Exception:
+        return False, out.getvalue().strip(), traceback.format_exc().strip()
+    finally:
+        sys.stdin = real_stdin
+    return not code, out.getvalue().strip(), err.getvalue().strip()
+
+
+def poll(fn, done, max_wait=3.0, delay=0.1):
+    """Call fn() until done(result) holds, backing off exponentially for up to ~max_wait seconds.
+
+    Used instead of fixed sleeps to wait for a write to show up in a follow-up read.
+    Returns the last result either way.
+    """
+    result = fn()
+    waited = 0.0
+    while not done(result) and waited < max_wait:
+        time.sleep(delay)
+        waited += delay
+        delay *= 2
+        result = fn()
+    return result
+
+
+def _xapi_subprocess(*args, timeout=30, stdin=""):
+    """Run an x-api-skill command in a fresh interpreter, return (ok, stdout, stderr)."""
+    _bootstrap()
     cmd = [sys.executable, str(SCRIPT)] + list(args)
     try:
         r = subprocess.run(
-            cmd, capture_output=True, text=True,
-            timeout=timeout, env=os.environ.copy(), cwd=str(ROOT_DIR),
+            cmd, input=stdin, capture_output=True, text=True,
+            timeout=timeout, cwd=str(ROOT_DIR),
         )
         return r.returncode == 0, r.stdout.strip(), r.stderr.strip()
     except subprocess.TimeoutExpired:
         return False, "", "Timed out (this is normal for streaming endpoints)"
 
 
-def pretty_json(text, max_lines=40):
-    """Try to pretty-print JSON output, truncating if long."""
+def _loads(text):
+    """Parse JSON text, with orjson when it is installed."""
+    return orjson.loads(text) if orjson is not None else json.loads(text)
+
+
+def _pretty(obj):
+    """Format obj as 2-space indented JSON, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+def _parse(text):
+    """Parse a command's JSON output, or return None if it isn't an object or array."""
+    if text.lstrip()[:1] not in ("{", "["):  # only attempt a parse when it can be JSON
+        return None
+    try:
+        return _loads(text)
+    except (ValueError, TypeError):
+        return None
+
+
+def _id_of(parsed):
+    """Return data.id from parsed command output (the new tweet/list ID), or None."""
     try:
-        parsed = json.loads(text)
-        formatted = json.dumps(parsed, indent=2)
-    except (json.JSONDecodeError, TypeError):
-        formatted = text
-    lines = formatted.splitlines()
-    if len(lines) > max_lines:
-        return "\n".join(lines[:max_lines]) + f"\n{DIM}... ({len(lines) - max_lines} more lines){RESET}"
-    return formatted
+        return parsed["data"]["id"]
+    except (KeyError, TypeError):
+        return None
+
+
+def pretty_json(text, max_lines=40, parsed=None):
+    """Try to pretty-print JSON output, truncating if long.
+
+    Pass parsed when the caller has already decoded text, to skip a second parse.
+    """
+    if parsed is None:
+        parsed = _parse(text)
+    formatted = text if parsed is None else _pretty(parsed)
+    # Find where line max_lines ends rather than splitting the whole payload into lines
+    cut = -1
+    for _ in range(max_lines):
+        cut = formatted.find("\n", cut + 1)
+        if cut < 0:
+            return formatted
+    if cut == len(formatted) - 1:
+        return formatted
+    more = formatted.count("\n", cut + 1) + (not formatted.endswith("\n"))
+    return formatted[:cut] + f"\n{DIM}... ({more} more lines){RESET}"
 
 
 # ── Display ──
 
 def clear():
-    os.system("cls" if os.name == "nt" else "clear")
+    """Clear the screen with an ANSI escape instead of spawning `clear`."""
+    if os.name == "nt" or not sys.stdout.isatty():
+        os.system("cls" if os.name == "nt" else "clear")
+        return
+    sys.stdout.write("\033[2J\033[H")
+    sys.stdout.flush()
 
 
 def header():
-    print(f"\n{BOLD}{CYAN}  x-api-skill — Interactive API Explorer{RESET}")
-    print(f"  {DIM}Run commands against the live X API and see results{RESET}")
-    print(f"  {CYAN}{'─' * 52}{RESET}")
+    sys.stdout.write(HEADER)
 
 
-def show_result(label, ok, stdout, stderr):
-    """Display the result of a command."""
+def show_result(label, ok, stdout, stderr, parsed=None):
+    """Display the result of a command. parsed is stdout already decoded, if the caller has it."""
     if ok:
-        print(f"\n  {GREEN}OK{RESET} {BOLD}{label}{RESET}")
+        print(OK_LABEL.format(label))
         if stdout:
-            for line in pretty_json(stdout).splitlines():
-                print(f"    {line}")
+            # Indent the (already truncated) block in one pass and print it in one call
+            print("    " + pretty_json(stdout, parsed=parsed).replace("\n", "\n    "))
         elif stderr:
             # Show informational stderr (e.g. "No liked tweets found") when stdout is empty
             for line in stderr.splitlines()[:5]:
-                print(f"    {DIM}{line}{RESET}")
+                print(DIM_LINE.format(line))
     else:
-        print(f"\n  {RED}ERROR{RESET} {BOLD}{label}{RESET}")
+        print(ERROR_LABEL.format(label))
         if stderr:
             for line in stderr.splitlines()[:10]:
-                print(f"    {YELLOW}{line}{RESET}")
+                print(WARN_LINE.format(line))
         if stdout:
             for line in stdout.splitlines()[:5]:
-                print(f"    {DIM}{line}{RESET}")
+                print(DIM_LINE.format(line))
     print()
 
 
@@ -108,7 +257,7 @@ def ask(prompt, default=""):
     """Prompt the user for input with a default value. Enter accepts default."""
     try:
         hint = f" [{default}]" if default else ""
-        val = input(f"  {BOLD}{prompt}{RESET}{DIM}{hint}{RESET}: ").strip()
+        val = input(ASK_PROMPT.format(prompt, hint)).strip()
         return val if val else default
     except (EOFError, KeyboardInterrupt):
         print()
@@ -118,7 +267,7 @@ def ask(prompt, default=""):
 def confirm_write(action="This will write to X"):
     """Ask user to confirm a write operation. Returns True if confirmed, False to skip."""
     try:
-        val = input(f"  {YELLOW}{action}. Proceed? (y/n){RESET} [{BOLD}y{RESET}]: ").strip().lower()
+        val = input(CONFIRM_PROMPT.format(action)).strip().lower()
         if val in ("n", "no", "skip"):
             print(f"  {DIM}Skipped write operations.{RESET}\n")
             return False
@@ -140,101 +289,100 @@ def pause():
 # The callable runs the test and prints results.
 
 
+def simple_test(name, desc, argv, prompts=(), intro=None, timeout=30):
+    """Build a test that asks for each (label, default) in prompts, then runs one command.
+
+    "{0}", "{1}", ... in argv are replaced by the answers, in prompt order.
+    """
+    def run():
+        answers = [ask(label, default) for label, default in prompts]
+        if intro:
+            print(f"\n  {DIM}{intro}{RESET}")
+        args = [arg.format(*answers) for arg in argv]
+        ok, out, err = xapi(*args, timeout=timeout)
+        label = " ".join(f'"{arg}"' if " " in arg else arg for arg in args)
+        show_result(f"x-api-skill {label}", ok, out, err)
+
+    return name, desc, run
+
+
 def build_tests():
     """Build the list of available tests."""
+    _bootstrap()  # TEST_TARGET_USERNAME may come from .env
     target = os.environ.get("TEST_TARGET_USERNAME", "").strip().lstrip("@")
     tests = []
+    me = {}
 
-    # ── 1. Auth & Account ──
-
-    def run_verify():
-        print(f"\n  {DIM}Checking OAuth 1.0a credentials...{RESET}")
-        ok, out, err = xapi("verify")
-        show_result("x-api-skill verify", ok, out, err)
+    def whoami():
+        """Return the authenticated username, looked up once per session (None if `me` fails)."""
+        if "username" not in me:
+            ok, out, _ = xapi("me")
+            try:
+                me["username"] = _loads(out).get("username") if ok else None
+            except (json.JSONDecodeError, TypeError, AttributeError):
+                me["username"] = None
+        return me["username"]
 
-    tests.append(("Verify credentials", "Check that your OAuth 1.0a keys work", run_verify))
+    # ── 1. Auth & Account ──
 
-    def run_me():
-        print(f"\n  {DIM}Fetching your profile...{RESET}")
-        ok, out, err = xapi("me")
-        show_result("x-api-skill me", ok, out, err)
+    tests.append(simple_test(
+        "Verify credentials", "Check that your OAuth 1.0a keys work",
+        ["verify"], intro="Checking OAuth 1.0a credentials...",
+    ))
 
-    tests.append(("My profile", "Fetch your authenticated user info", run_me))
+    tests.append(simple_test(
+        "My profile", "Fetch your authenticated user info",
+        ["me"], intro="Fetching your profile...",
+    ))
 
     # ── 2. User Lookup & Timeline ──
 
-    def run_user():
-        username = ask("Username to look up", "NASA")
-        ok, out, err = xapi("user", username)
-        show_result(f"x-api-skill user {username}", ok, out, err)
-
-    tests.append(("Look up user", "Fetch any user's profile — bio, location, follower counts", run_user))
-
-    def run_user_timeline():
-        username = ask("Username to read", "NASA")
-        count = ask("How many tweets", "5")
-        ok, out, err = xapi("user-timeline", username, "-n", count)
-        show_result(f"x-api-skill user-timeline {username} -n {count}", ok, out, err)
-
-    tests.append(("User timeline", "Get a user's latest tweets", run_user_timeline))
-
-    def run_search():
-        query = ask("Search query", "AI agents 2026")
-        count = ask("How many results", "5")
-        ok, out, err = xapi("search", query, "-n", count)
-        show_result(f'x-api-skill search "{query}" -n {count}', ok, out, err)
-
-    tests.append(("Search tweets", "Search recent tweets for any topic", run_search))
+    tests.append(simple_test(
+        "Look up user", "Fetch any user's profile — bio, location, follower counts",
+        ["user", "{0}"], [("Username to look up", "NASA")],
+    ))
 
-    def run_mentions():
-        count = ask("How many mentions", "5")
-        ok, out, err = xapi("mentions", "-n", count)
-        show_result(f"x-api-skill mentions -n {count}", ok, out, err)
+    tests.append(simple_test(
+        "User timeline", "Get a user's latest tweets",
+        ["user-timeline", "{0}", "-n", "{1}"], [("Username to read", "NASA"), ("How many tweets", "5")],
+    ))
 
-    tests.append(("My mentions", "Fetch tweets that mention you", run_mentions))
+    tests.append(simple_test(
+        "Search tweets", "Search recent tweets for any topic",
+        ["search", "{0}", "-n", "{1}"], [("Search query", "AI agents 2026"), ("How many results", "5")],
+    ))
 
-    def run_timeline():
-        count = ask("How many tweets", "5")
-        ok, out, err = xapi("timeline", "-n", count)
-        show_result(f"x-api-skill timeline -n {count}", ok, out, err)
+    tests.append(simple_test(
+        "My mentions", "Fetch tweets that mention you",
+        ["mentions", "-n", "{0}"], [("How many mentions", "5")],
+    ))
 
-    tests.append(("My timeline", "Fetch your home timeline (tweets from people you follow)", run_timeline))
+    tests.append(simple_test(
+        "My timeline", "Fetch your home timeline (tweets from people you follow)",
+        ["timeline", "-n", "{0}"], [("How many tweets", "5")],
+    ))
 
-    def run_latest_feed():
-        print(f"\n  {DIM}Fetching latest 10 tweets from your feed...{RESET}")
-        ok, out, err = xapi("timeline", "-n", "10")
-        show_result("x-api-skill timeline -n 10", ok, out, err)
-
-    tests.append(("Latest 10 on my feed", "Show the 10 most recent tweets on your home feed", run_latest_feed))
+    tests.append(simple_test(
+        "Latest 10 on my feed", "Show the 10 most recent tweets on your home feed",
+        ["timeline", "-n", "10"], intro="Fetching latest 10 tweets from your feed...",
+    ))
 
     # ── 3. Social Graph ──
 
-    def run_followers():
-        username = ask("Whose followers to list", "openai")
-        count = ask("How many", "10")
-        ok, out, err = xapi("followers", username, "-n", count)
-        show_result(f"x-api-skill followers {username} -n {count}", ok, out, err)
-
-    tests.append(("Followers", "List followers of any account", run_followers))
+    tests.append(simple_test(
+        "Followers", "List followers of any account",
+        ["followers", "{0}", "-n", "{1}"], [("Whose followers to list", "openai"), ("How many", "10")],
+    ))
 
-    def run_following():
-        username = ask("Whose following list", "openai")
-        count = ask("How many", "10")
-        ok, out, err = xapi("following", username, "-n", count)
-        show_result(f"x-api-skill following {username} -n {count}", ok, out, err)
-
-    tests.append(("Following", "List accounts that a user follows", run_following))
+    tests.append(simple_test(
+        "Following", "List accounts that a user follows",
+        ["following", "{0}", "-n", "{1}"], [("Whose following list", "openai"), ("How many", "10")],
+    ))
 
     def run_liked():
         username = ask("Whose liked tweets (most accounts have private likes — use your own)", "me")
         if username == "me":
-            # Resolve to the authenticated user
-            ok, out, err = xapi("me")
-            if ok:
-                try:
-                    username = json.loads(out).get("username", "me")
-                except (json.JSONDecodeError, TypeError, AttributeError):
-                    pass
+            username = whoami() or "me"
         count = ask("How many", "5")
         ok, out, err = xapi("liked", username, "-n", count)
         show_result(f"x-api-skill liked {username} -n {count}", ok, out, err)
@@ -251,35 +399,34 @@ def build_tests():
 
         print(f"\n  {DIM}1. Posting tweet...{RESET}")
         ok, out, err = xapi("tweet", text)
-        show_result(f'x-api-skill tweet "{text}"', ok, out, err)
+        parsed = _parse(out)
+        show_result(f'x-api-skill tweet "{text}"', ok, out, err, parsed=parsed)
         if not ok:
             return
 
-        tweet_id = json.loads(out).get("data", {}).get("id")
+        tweet_id = _id_of(parsed)
         if not tweet_id:
             print(f"    {RED}Could not extract tweet ID{RESET}")
             return
 
-        time.sleep(2)
-
         # Get
         print(f"  {DIM}2. Fetching tweet back by ID...{RESET}")
-        ok, out, err = xapi("get", tweet_id)
+        ok, out, err = poll(lambda: xapi("get", tweet_id), lambda r: r[0])
         show_result(f"x-api-skill get {tweet_id}", ok, out, err)
 
         # Reply
         reply_text = ask("Reply text", f"Replying to myself from x-api-skill!")
         print(f"  {DIM}3. Replying to tweet...{RESET}")
         ok, out, err = xapi("reply", tweet_id, reply_text)
-        show_result(f'x-api-skill reply {tweet_id} "{reply_text}"', ok, out, err)
+        parsed = _parse(out)
+        show_result(f'x-api-skill reply {tweet_id} "{reply_text}"', ok, out, err, parsed=parsed)
         reply_id = None
         if ok:
-            reply_id = json.loads(out).get("data", {}).get("id")
-            time.sleep(2)
+            reply_id = _id_of(parsed)
 
             # Thread
             print(f"  {DIM}4. Fetching conversation thread...{RESET}")
-            ok, out, err = xapi("thread", tweet_id)
+            ok, out, err = poll(lambda: xapi("thread", tweet_id), lambda r: r[0] and str(reply_id) in r[1])
             show_result(f"x-api-skill thread {tweet_id}", ok, out, err)
 
         # Cleanup
@@ -314,8 +461,9 @@ def build_tests():
         if not ok:
             show_result("x-api-skill tweet", ok, out, err)
             return
-        tweet_id = json.loads(out).get("data", {}).get("id")
-        show_result(f'x-api-skill tweet "{text}"', ok, out, err)
+        parsed = _parse(out)
+        tweet_id = _id_of(parsed)
+        show_result(f'x-api-skill tweet "{text}"', ok, out, err, parsed=parsed)
         time.sleep(1)
 
         print(f"  {DIM}Liking tweet {tweet_id}...{RESET}")
@@ -341,13 +489,13 @@ def build_tests():
         if not ok:
             show_result("x-api-skill tweet", ok, out, err)
             return
-        tweet_id = json.loads(out).get("data", {}).get("id")
-        show_result(f'x-api-skill tweet "{text}"', ok, out, err)
+        parsed = _parse(out)
+        tweet_id = _id_of(parsed)
+        show_result(f'x-api-skill tweet "{text}"', ok, out, err, parsed=parsed)
         time.sleep(1)
         xapi("like", tweet_id)
         print(f"  {DIM}Liked! Now checking who liked it...{RESET}")
-        time.sleep(2)
-        ok, out, err = xapi("liking-users", tweet_id)
+        ok, out, err = poll(lambda: xapi("liking-users", tweet_id), lambda r: r[0] and r[1])
         show_result(f"x-api-skill liking-users {tweet_id}", ok, out, err)
         print(f"  {DIM}Cleaning up...{RESET}")
         xapi("unlike", tweet_id)
@@ -365,8 +513,9 @@ def build_tests():
         if not ok:
             show_result("x-api-skill tweet", ok, out, err)
             return
-        tweet_id = json.loads(out).get("data", {}).get("id")
-        show_result(f'x-api-skill tweet "{text}"', ok, out, err)
+        parsed = _parse(out)
+        tweet_id = _id_of(parsed)
+        show_result(f'x-api-skill tweet "{text}"', ok, out, err, parsed=parsed)
         time.sleep(1)
 
         print(f"  {DIM}Retweeting...{RESET}")
@@ -393,13 +542,13 @@ def build_tests():
         if not ok:
             show_result("x-api-skill tweet", ok, out, err)
             return
-        tweet_id = json.loads(out).get("data", {}).get("id")
-        show_result(f'x-api-skill tweet "{text}"', ok, out, err)
+        parsed = _parse(out)
+        tweet_id = _id_of(parsed)
+        show_result(f'x-api-skill tweet "{text}"', ok, out, err, parsed=parsed)
         time.sleep(1)
         xapi("retweet", tweet_id)
         print(f"  {DIM}Retweeted! Now checking who retweeted it...{RESET}")
-        time.sleep(2)
-        ok, out, err = xapi("retweeters", tweet_id)
+        ok, out, err = poll(lambda: xapi("retweeters", tweet_id), lambda r: r[0] and r[1])
         show_result(f"x-api-skill retweeters {tweet_id}", ok, out, err)
         print(f"  {DIM}Cleaning up...{RESET}")
         xapi("unretweet", tweet_id)
@@ -425,6 +574,19 @@ def build_tests():
 
     tests.append(("Follow / Unfollow", "Follow a user and immediately unfollow them", run_follow_unfollow))
 
+    def run_bulk_errors():
+        username = ask("Username that doesn't exist", "no-such-user")
+        print(f"\n  {DIM}Running `follow {username}` through bulk...{RESET}")
+        ok, out, err = xapi("bulk", stdin=f"follow {username}\n")
+        show_result(f"echo 'follow {username}' | x-api-skill bulk", ok, out, err)
+        errors = [line for line in err.splitlines() if not line.startswith("bulk:")]
+        if not ok and errors and all(line.startswith("[line 1] ") for line in errors):
+            print(f"    {GREEN}(Expected! The failure is attributed to its input line){RESET}")
+        else:
+            print(f"    {RED}Expected a failure with every error line prefixed by [line 1]{RESET}")
+
+    tests.append(("Bulk error prefix", "Run a failing follow through bulk and check its errors carry [line N]", run_bulk_errors))
+
     # ── 7. Hide / Unhide Replies ──
 
     def run_hide_unhide():
@@ -437,8 +599,9 @@ def build_tests():
         if not ok:
             show_result("x-api-skill tweet", ok, out, err)
             return
-        tweet_id = json.loads(out).get("data", {}).get("id")
-        show_result(f'x-api-skill tweet "{parent_text}"', ok, out, err)
+        parsed = _parse(out)
+        tweet_id = _id_of(parsed)
+        show_result(f'x-api-skill tweet "{parent_text}"', ok, out, err, parsed=parsed)
         time.sleep(1)
 
         print(f"  {DIM}Posting reply...{RESET}")
@@ -447,8 +610,9 @@ def build_tests():
             show_result("x-api-skill reply", ok, out, err)
             xapi("delete", tweet_id)
             return
-        reply_id = json.loads(out).get("data", {}).get("id")
-        show_result(f'x-api-skill reply {tweet_id} "{reply_text}"', ok, out, err)
+        parsed = _parse(out)
+        reply_id = _id_of(parsed)
+        show_result(f'x-api-skill reply {tweet_id} "{reply_text}"', ok, out, err, parsed=parsed)
         time.sleep(1)
 
         print(f"  {DIM}Hiding reply {reply_id}...{RESET}")
@@ -501,12 +665,10 @@ def build_tests():
 
     # ── 9. Direct Messages ──
 
-    def run_dm_list():
-        count = ask("How many DM events", "5")
-        ok, out, err = xapi("dm-list", "-n", count)
-        show_result(f"x-api-skill dm-list -n {count}", ok, out, err)
-
-    tests.append(("List DMs", "Show your most recent DM events (messages sent and received)", run_dm_list))
+    tests.append(simple_test(
+        "List DMs", "Show your most recent DM events (messages sent and received)",
+        ["dm-list", "-n", "{0}"], [("How many DM events", "5")],
+    ))
 
     def run_dm_send():
         username = ask("Username to DM", target or "")
@@ -543,7 +705,7 @@ def build_tests():
 
         rule_id = None
         try:
-            rules = json.loads(out).get("data", [])
+            rules = _loads(out).get("data", [])
             if rules:
                 rule_id = rules[0].get("id")
         except (json.JSONDecodeError, TypeError):
@@ -556,36 +718,28 @@ def build_tests():
 
     tests.append(("Stream rules", "Add, list, and delete a filtered stream rule (Pro tier)", run_stream_rules))
 
-    def run_stream_filter():
-        print(f"\n  {DIM}Connecting to filtered stream (will timeout if no matching tweets)...{RESET}")
-        ok, out, err = xapi("stream-filter", "-n", "1", timeout=10)
-        show_result("x-api-skill stream-filter -n 1", ok, out, err)
-
-    tests.append(("Filtered stream", "Connect to filtered stream — receives tweets matching your rules (Pro)", run_stream_filter))
-
-    def run_stream_sample():
-        print(f"\n  {DIM}Connecting to 1% volume stream...{RESET}")
-        ok, out, err = xapi("stream-sample", "-n", "1", timeout=10)
-        show_result("x-api-skill stream-sample -n 1", ok, out, err)
-
-    tests.append(("Volume stream", "Connect to the 1% sample stream of all tweets (Pro)", run_stream_sample))
+    tests.append(simple_test(
+        "Filtered stream", "Connect to filtered stream — receives tweets matching your rules (Pro)",
+        ["stream-filter", "-n", "1"], timeout=10,
+        intro="Connecting to filtered stream (will timeout if no matching tweets)...",
+    ))
 
-    def run_search_all():
-        query = ask("Full-archive search query", "from:NASA moon landing")
-        count = ask("How many results", "5")
-        ok, out, err = xapi("search-all", query, "-n", count)
-        show_result(f'x-api-skill search-all "{query}" -n {count}', ok, out, err)
+    tests.append(simple_test(
+        "Volume stream", "Connect to the 1% sample stream of all tweets (Pro)",
+        ["stream-sample", "-n", "1"], timeout=10, intro="Connecting to 1% volume stream...",
+    ))
 
-    tests.append(("Full-archive search", "Search ALL historical tweets, not just recent (Pro)", run_search_all))
+    tests.append(simple_test(
+        "Full-archive search", "Search ALL historical tweets, not just recent (Pro)",
+        ["search-all", "{0}", "-n", "{1}"], [("Full-archive search query", "from:NASA moon landing"), ("How many results", "5")],
+    ))
 
     # ── 11. Bookmarks ──
 
-    def run_bookmarks_list():
-        count = ask("How many bookmarks", "5")
-        ok, out, err = xapi("bookmarks", "-n", count)
-        show_result(f"x-api-skill bookmarks -n {count}", ok, out, err)
-
-    tests.append(("List bookmarks", "Show your most recent bookmarked tweets", run_bookmarks_list))
+    tests.append(simple_test(
+        "List bookmarks", "Show your most recent bookmarked tweets",
+        ["bookmarks", "-n", "{0}"], [("How many bookmarks", "5")],
+    ))
 
     def run_bookmark_add():
         text = ask("Tweet text to bookmark", f"Bookmarking this for later [{uuid.uuid4().hex[:6]}]")
@@ -596,8 +750,9 @@ def build_tests():
         if not ok:
             show_result("x-api-skill tweet", ok, out, err)
             return
-        tweet_id = json.loads(out).get("data", {}).get("id")
-        show_result(f'x-api-skill tweet "{text}"', ok, out, err)
+        parsed = _parse(out)
+        tweet_id = _id_of(parsed)
+        show_result(f'x-api-skill tweet "{text}"', ok, out, err, parsed=parsed)
         time.sleep(1)
 
         # Bookmark it
@@ -611,11 +766,9 @@ def build_tests():
             print(f"    Deleted tweet {tweet_id}")
             return
 
-        time.sleep(1)
-
         # List bookmarks to show it's there
         print(f"  {DIM}Fetching bookmarks to confirm...{RESET}")
-        ok, out, err = xapi("bookmarks", "-n", "5")
+        ok, out, err = poll(lambda: xapi("bookmarks", "-n", "5"), lambda r: r[0] and tweet_id in r[1])
         show_result("x-api-skill bookmarks -n 5", ok, out, err)
 
         # Unbookmark and clean up
@@ -627,21 +780,17 @@ def build_tests():
 
     tests.append(("Bookmark a tweet", "Post a tweet, bookmark it, verify it appears in bookmarks, then clean up", run_bookmark_add))
 
-    def run_bookmark_folders():
-        print(f"\n  {DIM}Listing bookmark folders...{RESET}")
-        ok, out, err = xapi("bookmark-folders")
-        show_result("x-api-skill bookmark-folders", ok, out, err)
-
-    tests.append(("Bookmark folders", "List your bookmark folders (if you've organized bookmarks into folders)", run_bookmark_folders))
+    tests.append(simple_test(
+        "Bookmark folders", "List your bookmark folders (if you've organized bookmarks into folders)",
+        ["bookmark-folders"], intro="Listing bookmark folders...",
+    ))
 
     # ── 12. Lists ──
 
-    def run_my_lists():
-        print(f"\n  {DIM}Listing your owned lists...{RESET}")
-        ok, out, err = xapi("my-lists")
-        show_result("x-api-skill my-lists", ok, out, err)
-
-    tests.append(("My lists", "Show all X Lists you've created", run_my_lists))
+    tests.append(simple_test(
+        "My lists", "Show all X Lists you've created",
+        ["my-lists"], intro="Listing your owned lists...",
+    ))
 
     def run_list_lifecycle():
         list_name = ask("New list name", f"x-api-skill-demo-{uuid.uuid4().hex[:6]}")
@@ -653,30 +802,31 @@ def build_tests():
 
         print(f"\n  {DIM}1. Creating list \"{list_name}\"...{RESET}")
         ok, out, err = xapi("list-create", list_name, "--description", list_desc)
-        show_result(f'x-api-skill list-create "{list_name}" --description "{list_desc}"', ok, out, err)
+        parsed = _parse(out)
+        show_result(f'x-api-skill list-create "{list_name}" --description "{list_desc}"', ok, out, err, parsed=parsed)
         if not ok:
             return
-        list_id = json.loads(out).get("data", {}).get("id")
+        list_id = _id_of(parsed)
         if not list_id:
             print(f"    {RED}Could not extract list ID{RESET}")
             return
 
-        time.sleep(1)
-
         # Lookup
         print(f"  {DIM}2. Looking up list by ID...{RESET}")
-        ok, out, err = xapi("list", list_id)
+        ok, out, err = poll(lambda: xapi("list", list_id), lambda r: r[0])
         show_result(f"x-api-skill list {list_id}", ok, out, err)
 
         # Add member
         print(f"  {DIM}3. Adding @{member} to list...{RESET}")
         ok, out, err = xapi("list-add-member", list_id, member)
         show_result(f"x-api-skill list-add-member {list_id} {member}", ok, out, err)
-        time.sleep(1)
 
         # Members
         print(f"  {DIM}4. Listing members...{RESET}")
-        ok, out, err = xapi("list-members", list_id)
+        ok, out, err = poll(
+            lambda: xapi("list-members", list_id),
+            lambda r: r[0] and f'"{member.lstrip("@").lower()}"' in r[1].lower(),
+        )
         show_result(f"x-api-skill list-members {list_id}", ok, out, err)
 
         # Tweets
@@ -698,19 +848,15 @@ def build_tests():
 
     # ── 13. Trends & Spaces ──
 
-    def run_trends():
-        woeid = ask("WOEID (1=worldwide, 23424977=US, 23424975=UK)", "1")
-        ok, out, err = xapi("trends", "--woeid", woeid)
-        show_result(f"x-api-skill trends --woeid {woeid}", ok, out, err)
-
-    tests.append(("Trends", "See what's trending — worldwide or for a specific country", run_trends))
+    tests.append(simple_test(
+        "Trends", "See what's trending — worldwide or for a specific country",
+        ["trends", "--woeid", "{0}"], [("WOEID (1=worldwide, 23424977=US, 23424975=UK)", "1")],
+    ))
 
-    def run_spaces():
-        query = ask("Search Spaces about", "AI startups")
-        ok, out, err = xapi("spaces", query)
-        show_result(f'x-api-skill spaces "{query}"', ok, out, err)
-
-    tests.append(("Search Spaces", "Find live or scheduled X Spaces on a topic", run_spaces))
+    tests.append(simple_test(
+        "Search Spaces", "Find live or scheduled X Spaces on a topic",
+        ["spaces", "{0}"], [("Search Spaces about", "AI startups")],
+    ))
 
     # ── 14. Profile ──
 
@@ -728,21 +874,26 @@ def build_tests():
 
 # ── Main Loop ──
 
+def render_menu(tests):
+    """Render the whole menu as one string so each redraw is a single write."""
+    parts = [""]
+    for i, (name, desc, _) in enumerate(tests, 1):
+        parts.append(f"  {BOLD}{CYAN}{i:2d}{RESET}  {BOLD}{name}{RESET}")
+        parts.append(f"      {DIM}{desc}{RESET}")
+    parts.append(f"\n  {BOLD}{CYAN} a{RESET}  {BOLD}Run all{RESET}")
+    parts.append(f"      {DIM}Execute every test sequentially{RESET}")
+    parts.append(f"\n  {BOLD}{CYAN} q{RESET}  {BOLD}Quit{RESET}\n\n")
+    return "\n".join(parts)
+
+
 def main():
-    tests = build_tests()
+    tests = tuple(build_tests())  # built once and never changed afterwards
+    menu = render_menu(tests)
 
     while True:
         clear()
         header()
-        print()
-
-        for i, (name, desc, _) in enumerate(tests, 1):
-            print(f"  {BOLD}{CYAN}{i:2d}{RESET}  {BOLD}{name}{RESET}")
-            print(f"      {DIM}{desc}{RESET}")
-
-        print(f"\n  {BOLD}{CYAN} a{RESET}  {BOLD}Run all{RESET}")
-        print(f"      {DIM}Execute every test sequentially{RESET}")
-        print(f"\n  {BOLD}{CYAN} q{RESET}  {BOLD}Quit{RESET}\n")
+        sys.stdout.write(menu)
 
         try:
             choice = input(f"  {BOLD}Choose> {RESET}").strip().lower()
@@ -756,9 +907,11 @@ def main():
             clear()
             header()
             for i, (name, desc, fn) in enumerate(tests, 1):
-                print(f"\n  {CYAN}{'━' * 52}{RESET}")
-                print(f"  {BOLD}[{i}/{len(tests)}] {name}{RESET}")
-                print(f"  {DIM}{desc}{RESET}")
+                sys.stdout.write(
+                    f"\n  {CYAN}{'━' * 52}{RESET}\n"
+                    f"  {BOLD}[{i}/{len(tests)}] {name}{RESET}\n"
+                    f"  {DIM}{desc}{RESET}\n"
+                )
                 fn()
                 pause()
             continue